@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared binary CSV writer for the bulk seed generators.
+
+Lines are pre-encoded UTF-8 CSV rows (CRLF-terminated, as csv.writer emits);
+output starts with a UTF-8 BOM so Excel opens Kreyòl text correctly.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+from itertools import islice
+from pathlib import Path
+
+BOM = b'\xef\xbb\xbf'
+COPY_BUFFER = 1 << 20
+# Rows per write_sharded block; each block has its own seed
+BLOCK_ROWS = 10_000
+
+
+def encode_header(fieldnames) -> bytes:
+    return (','.join(fieldnames) + '\r\n').encode('utf-8')
+
+
+def _write_all(fd:int, chunks:list):
+    """Write chunks with one os.writev call, finishing any short write."""
+    if not hasattr(os, 'writev'):  # Windows
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        return
+    written = os.writev(fd, chunks)
+    if written == sum(map(len, chunks)):
+        return
+    # Short write: skip what went out and finish the rest chunk by chunk
+    for chunk in chunks:
+        if written >= len(chunk):
+            written -= len(chunk)
+            continue
+        view = memoryview(chunk)[written:]
+        written = 0
+        while view:
+            view = view[os.write(fd, view):]
+
+
+def write_lines(path:Path, lines, prefix:bytes=b'', chunk:int=10_000):
+    """Write prefix plus encoded lines, joining `chunk` lines per syscall."""
+    lines = iter(lines)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        pending = [prefix] if prefix else []
+        while True:
+            body = b''.join(islice(lines, chunk))
+            if body:
+                pending.append(body)
+            if pending:
+                _write_all(fd, pending)
+            if not body:
+                break
+            pending = []
+    finally:
+        os.close(fd)
+
+
+def bulk_write(path:Path, fieldnames, lines, chunk:int=10_000):
+    """Write BOM, header and encoded CSV lines to path."""
+    write_lines(path, lines, BOM + encode_header(fieldnames), chunk)
+
+
+def _write_block(job):
+    """Pool worker: write one block's lines (no BOM, no header) to its own file."""
+    block_lines, path, count, start, seed = job
+    write_lines(path, block_lines(count, start, seed))
+    return path
+
+
+def write_sharded(path:Path, fieldnames, block_lines, count:int, seed:int=0, workers:int=0,
+                  block_rows:int=BLOCK_ROWS):
+    """Generate lines in fixed-size blocks across worker processes and concatenate them.
+
+    block_lines(count, start, seed) must be a module-level function returning
+    encoded lines for rows start..start+count. Block b covers rows
+    b*block_rows onwards and gets seed + b, so the output depends only on
+    count and seed; workers only changes how many blocks run at once.
+    """
+    workers = workers or os.cpu_count() or 1
+    starts = range(0, count, block_rows)
+    with tempfile.TemporaryDirectory(dir=path.parent) as tmp:
+        jobs = [(block_lines, Path(tmp) / f"block_{b}.csv", min(block_rows, count - start), start, seed + b)
+                for b, start in enumerate(starts)]
+        with multiprocessing.Pool(min(workers, len(jobs) or 1)) as pool:
+            block_paths = pool.map(_write_block, jobs)
+        with path.open('wb', buffering=COPY_BUFFER) as dst:
+            dst.write(BOM + encode_header(fieldnames))
+            for block_path in block_paths:
+                with open(block_path, 'rb') as src:
+                    shutil.copyfileobj(src, dst, length=COPY_BUFFER)
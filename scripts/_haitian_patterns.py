@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the curated Haitian Creole grammatical patterns.
+
+The patterns live in haitian_patterns_data.csv next to this module and are
+read on first use. Rows with an empty domain get one assigned per row by
+the generators.
+"""
+import csv
+from functools import lru_cache
+from pathlib import Path
+
+PATTERNS_DATA_FILE = Path(__file__).parent / "haitian_patterns_data.csv"
+
+
+@lru_cache(maxsize=None)
+def load_patterns():
+    """Return (group, pattern) pairs in file order; patterns without a domain are 7-tuples."""
+    with PATTERNS_DATA_FILE.open(encoding="utf-8", newline="") as f:
+        rows = csv.reader(f)
+        next(rows)  # header
+        return tuple((group, tuple(fields) if fields[-1] else tuple(fields[:-1]))
+                     for group, *fields in rows)
+
+
+def generate_pattern_variants():
+    """Domain-specific pattern variants (the "variant" group of the data file)"""
+    return tuple(pattern for group, pattern in load_patterns() if group == "variant")
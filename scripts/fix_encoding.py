@@ -9,14 +9,28 @@ This script:
 4. Re-saves with clean UTF-8 encoding
 """
 
+import io
 import os
+import re
+import mmap
 import sys
 import csv
 import chardet
+from collections import Counter
 from pathlib import Path
 import shutil
 from datetime import datetime
 
+try:
+    import ahocorasick  # Optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ftfy  # Optional: pip install ftfy
+except ImportError:
+    ftfy = None
+
 
 # Common Kreyol character corruptions (double-encoded UTF-8)
 ENCODING_FIXES = {
@@ -57,6 +71,33 @@ ENCODING_FIXES = {
     'Ã¿': 'ÿ',
 }
 
+# Single alternation over all corruption keys, longest first so compound
+# patterns like 'fyÃ¨l' win over their 'Ã¨' substring
+_MOJI_RE = re.compile('|'.join(
+    re.escape(wrong) for wrong in sorted(ENCODING_FIXES, key=len, reverse=True)
+))
+
+# Byte-level equivalents for UTF-8 input: fix without decoding to str
+_BYTE_FIXES = {wrong.encode('utf-8'): correct.encode('utf-8') for wrong, correct in ENCODING_FIXES.items()}
+_BMOJI_RE = re.compile(b'|'.join(
+    re.escape(wrong) for wrong in sorted(_BYTE_FIXES, key=len, reverse=True)
+))
+
+# Aho-Corasick automaton over the same keys: one linear C-level walk per text
+if ahocorasick is not None:
+    _AC = ahocorasick.Automaton()
+    for _wrong, _correct in ENCODING_FIXES.items():
+        _AC.add_word(_wrong, (_wrong, _correct))
+    _AC.make_automaton()
+else:
+    _AC = None
+
+# Counter key for lines repaired by ftfy rather than by ENCODING_FIXES
+FTFY_KEY = 'ftfy: lines repaired'
+
+_BOM_BYTES = b'\xef\xbb\xbf'
+_MOJI_SIGNATURE = 'Ã'.encode('utf-8')
+
 
 def detect_encoding(file_path):
     """Detect the actual encoding of a file."""
@@ -66,6 +107,11 @@ def detect_encoding(file_path):
         return result['encoding'], result['confidence']
 
 
+def _is_utf8_label(encoding):
+    """True if a chardet encoding label means the bytes are already UTF-8."""
+    return bool(encoding) and encoding.lower() in ('utf-8', 'utf-8-sig', 'ascii')
+
+
 def has_bom(file_path):
     """Check if file starts with UTF-8 BOM."""
     with open(file_path, 'rb') as f:
@@ -73,6 +119,76 @@ def has_bom(file_path):
         return first_bytes == b'\xef\xbb\xbf'
 
 
+def fix_mojibake_bytes(raw):
+    """Byte-level fix_mojibake for UTF-8 data; counts are keyed by str pattern."""
+    counts = Counter()
+    
+    def _replace(match):
+        wrong = match.group(0)
+        counts[wrong.decode('utf-8')] += 1
+        return _BYTE_FIXES[wrong]
+    
+    return _BMOJI_RE.sub(_replace, raw), counts
+
+
+def _fix_mojibake_ac(text, counts):
+    """Aho-Corasick variant of fix_mojibake, matching _MOJI_RE semantics.
+    
+    Overlapping matches are resolved leftmost first, then longest first.
+    """
+    matches = sorted(
+        (end - len(wrong) + 1, -len(wrong), wrong, correct)
+        for end, (wrong, correct) in _AC.iter(text)
+    )
+    
+    parts = []
+    pos = 0
+    for start, _, wrong, correct in matches:
+        if start < pos:
+            continue
+        parts.append(text[pos:start])
+        parts.append(correct)
+        counts[wrong] += 1
+        pos = start + len(wrong)
+    
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _needs_fixing_fast(file_path):
+    """Cheap byte-level prefilter: True if the file may need ENCODING_FIXES.
+    
+    Every ENCODING_FIXES key contains 'Ã', whose UTF-8 encoding is
+    b'\xc3\x83'; a file containing neither that nor a BOM can be skipped.
+    ftfy repairs mojibake without that signature (e.g. 'â€™'), so main()
+    only applies this filter when ftfy is not installed.
+    """
+    if os.path.getsize(file_path) == 0:
+        return False
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(_BOM_BYTES, 0, 3) != -1 or mm.find(_MOJI_SIGNATURE) != -1
+
+
+def copy_backup(src_path, dst_path):
+    """Copy a file like shutil.copy2, using in-kernel sendfile where available."""
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+            remaining = os.fstat(src.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        else:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+    shutil.copystat(src_path, dst_path)
+
+
 def remove_bom(content):
     """Remove BOM from string content."""
     if content.startswith('\ufeff'):
@@ -81,88 +197,109 @@ def remove_bom(content):
 
 
 def fix_mojibake(text):
-    """Fix common UTF-8 double-encoding issues."""
+    """Fix common UTF-8 double-encoding issues.
+    
+    When ftfy is installed it repairs the general mojibake layer first;
+    ENCODING_FIXES then runs as a post-pass for corpus-specific patterns.
+    
+    Returns a ``(fixed_text, counts)`` tuple where ``counts`` maps each
+    corrupted pattern to the number of times it was replaced.
+    """
+    counts = Counter()
     if not text:
-        return text
+        return text, counts
+    
+    if ftfy is not None:
+        repaired = ftfy.fix_encoding(text)
+        if repaired != text:
+            counts[FTFY_KEY] = sum(
+                before != after
+                for before, after in zip(text.splitlines(), repaired.splitlines())
+            )
+            text = repaired
     
-    fixed_text = text
-    for wrong, correct in ENCODING_FIXES.items():
-        fixed_text = fixed_text.replace(wrong, correct)
+    if _AC is not None:
+        return _fix_mojibake_ac(text, counts), counts
     
-    return fixed_text
+    def _replace(match):
+        wrong = match.group(0)
+        counts[wrong] += 1
+        return ENCODING_FIXES[wrong]
+    
+    return _MOJI_RE.sub(_replace, text), counts
 
 
 def fix_csv_file(input_path, output_path, backup_path):
-    """Fix encoding issues in a CSV file."""
-    print(f"\n{'='*60}")
-    print(f"Processing: {input_path.name}")
-    print(f"{'='*60}")
+    """Fix encoding issues in a CSV file.
+    
+    Log lines are buffered and returned with the result, as
+    ``(was_fixed, log_text)``, so callers can emit them in one write.
+    """
+    log = io.StringIO()
+    print(f"\n{'='*60}", file=log)
+    print(f"Processing: {input_path.name}", file=log)
+    print(f"{'='*60}", file=log)
     
     # Detect current encoding
     detected_encoding, confidence = detect_encoding(input_path)
-    print(f"Detected encoding: {detected_encoding} (confidence: {confidence:.2%})")
+    print(f"Detected encoding: {detected_encoding} (confidence: {confidence:.2%})", file=log)
     
     # Check for BOM
     has_bom_marker = has_bom(input_path)
     if has_bom_marker:
-        print("⚠️  BOM detected - will be removed")
+        print("⚠️  BOM detected - will be removed", file=log)
     
     # Create backup
-    shutil.copy2(input_path, backup_path)
-    print(f"✅ Backup created: {backup_path.name}")
+    copy_backup(input_path, backup_path)
+    print(f"✅ Backup created: {backup_path.name}", file=log)
     
-    # Read file
-    try:
-        with open(input_path, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Try with detected encoding
-        with open(input_path, 'r', encoding=detected_encoding) as f:
-            content = f.read()
-    
-    # Remove BOM if present
-    content = remove_bom(content)
-    
-    # Count issues before fixing
-    issues_found = 0
-    for wrong in ENCODING_FIXES.keys():
-        count = content.count(wrong)
-        if count > 0:
-            issues_found += count
-            print(f"  Found: '{wrong}' ({count} occurrences)")
+    # Fix mojibake, counting issues in the same pass. UTF-8 input is fixed
+    # directly on the raw bytes unless ftfy needs decoded text.
+    with open(input_path, 'rb') as f:
+        raw = f.read()
+    
+    if ftfy is None and _is_utf8_label(detected_encoding):
+        fixed_bytes, issue_counts = fix_mojibake_bytes(raw[len(_BOM_BYTES):] if raw.startswith(_BOM_BYTES) else raw)
+    else:
+        try:
+            content = raw.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            # Try with detected encoding
+            content = raw.decode(detected_encoding)
+        fixed_content, issue_counts = fix_mojibake(remove_bom(content))
+        fixed_bytes = fixed_content.encode('utf-8')
+    
+    issues_found = sum(issue_counts.values())
+    for wrong, count in issue_counts.items():
+        print(f"  Found: '{wrong}' ({count} occurrences)", file=log)
     
     if issues_found == 0 and not has_bom_marker:
-        print("✅ No encoding issues detected")
-        return False
+        print("✅ No encoding issues detected", file=log)
+        return False, log.getvalue()
     
     if issues_found > 0:
-        print(f"\n🔧 Fixing {issues_found} encoding issues...")
+        print(f"\n🔧 Fixing {issues_found} encoding issues...", file=log)
     elif has_bom_marker:
-        print(f"\n🔧 Removing BOM...")
-    
-    # Fix mojibake
-    fixed_content = fix_mojibake(content)
+        print(f"\n🔧 Removing BOM...", file=log)
     
     # Write corrected file
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        f.write(fixed_content)
+    with open(output_path, 'wb') as f:
+        f.write(fixed_bytes)
     
-    print(f"✅ Fixed file saved: {output_path.name}")
+    print(f"✅ Fixed file saved: {output_path.name}", file=log)
     
     # Verify the fix
-    with open(output_path, 'r', encoding='utf-8') as f:
+    with open(output_path, 'rb') as f:
         verification = f.read()
     
-    verification_issues = 0
-    for wrong in ENCODING_FIXES.keys():
-        verification_issues += verification.count(wrong)
+    verification_issues = len(_BMOJI_RE.findall(verification))
     
     if verification_issues == 0:
-        print("✅ Verification passed - all issues resolved")
-        return True
+        print("✅ Verification passed - all issues resolved", file=log)
+        return True, log.getvalue()
     else:
-        print(f"⚠️  Warning: {verification_issues} issues remain after fixing")
-        return True
+        print(f"⚠️  Warning: {verification_issues} issues remain after fixing", file=log)
+        return True, log.getvalue()
 
 
 def main():
@@ -196,10 +333,15 @@ def main():
     # Process each file
     fixed_count = 0
     for csv_file in sorted(csv_files):
+        if ftfy is None and not _needs_fixing_fast(csv_file):
+            print(f"\n✅ {csv_file.name}: no BOM or mojibake signature, skipped")
+            continue
+        
         backup_path = backup_dir / csv_file.name
         output_path = csv_file  # Overwrite original
         
-        was_fixed = fix_csv_file(csv_file, output_path, backup_path)
+        was_fixed, log_text = fix_csv_file(csv_file, output_path, backup_path)
+        sys.stdout.write(log_text)
         if was_fixed:
             fixed_count += 1
     
@@ -46,34 +46,26 @@ POLYSEMY = [
     ("They charged him a fee", "Yo fè l peye yon frè", "Financial sense"),
 ]
 
+# (category, phenomenon, examples), in CATEGORIES order
 BUCKETS = [
-    ("idiom", IDIOMS),
-    ("negation", NEGATIONS),
-    ("dosage", DOSAGE),
-    ("ambiguity", AMBIG),
-    ("numbers", NUMBERS),
-    ("polysemy", POLYSEMY),
+    (cat, desc, examples)
+    for (cat, desc), examples in zip(CATEGORIES, [IDIOMS, NEGATIONS, DOSAGE, AMBIG, NUMBERS, POLYSEMY])
 ]
 
+EXPECTED_BEHAVIOR = "Test model preserves meaning; avoid literal traps; handle scope/units/format"
+
+FIELDNAMES = ["id", "category", "src_en", "src_ht", "phenomenon", "expected_behavior", "notes"]
+
 
 def synthesize(count: int):
-    rows = []
+    """Return challenge rows as tuples in FIELDNAMES order."""
+    rows = [None] * count
     cyc = cycle(BUCKETS)
-    uid = 1
-    while len(rows) < count:
-        cat, examples = next(cyc)
-        ex = examples[uid % len(examples)]
-        src_en, src_ht, note = ex
-        rows.append({
-            "id": uid,
-            "category": cat,
-            "src_en": src_en,
-            "src_ht": src_ht,
-            "phenomenon": dict(CATEGORIES)[cat] if isinstance(dict(CATEGORIES).get(cat), str) else cat,
-            "expected_behavior": "Test model preserves meaning; avoid literal traps; handle scope/units/format",
-            "notes": note,
-        })
-        uid += 1
+    for idx in range(count):
+        uid = idx + 1
+        cat, phenomenon, examples = next(cyc)
+        src_en, src_ht, note = examples[uid % len(examples)]
+        rows[idx] = (uid, cat, src_en, src_ht, phenomenon, EXPECTED_BEHAVIOR, note)
     return rows
 
 
@@ -86,12 +78,9 @@ def main():
     args.output.parent.mkdir(parents=True, exist_ok=True)
     rows = synthesize(args.count)
 
-    with args.output.open("w", encoding="utf-8-sig", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["id", "category", "src_en", "src_ht", "phenomenon", "expected_behavior", "notes"],
-        )
-        writer.writeheader()
+    with args.output.open("w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
         writer.writerows(rows)
 
     print(f"✅ Wrote {len(rows)} challenge items to {args.output}")
@@ -11,6 +11,26 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    import orjson  # Optional: C-backed JSON encoder
+except ImportError:
+    orjson = None
+
+# Column order shared by the INSERT statement and the row tuples
+CODE_SWITCH_COLUMNS = (
+    'id', 'src_text_mixed', 'src_lang_primary', 'tgt_lang_primary',
+    'clean_translation', 'annotated_translation', 'src_lang_tags',
+    'tgt_lang_tags', 'code_switch_type', 'domain', 'context',
+    'provenance', 'confidence',
+)
+
+
+def _dumps(obj) -> str:
+    """Serialize language-span tags to compact JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
 
 def create_code_switch_examples():
     """Create initial code-switching training examples"""
@@ -24,12 +44,12 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "I'm a mechanic. I don't deal with the bad guys who steal people's money in this neighborhood.",
             'annotated_translation': "I'm a mechanic. I don't deal with the bad guys (lougouwou) who steal people's money in this neighborhood.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 59, 'lang': 'hat_Latn'},
                 {'start': 23, 'end': 27, 'lang': 'eng_Latn'},  # "deal"
                 {'start': 50, 'end': 59, 'lang': 'hat_Latn'}   # "lougouwou"
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 14, 'end': 18, 'lang': 'eng_Latn'},   # "deal"
                 {'start': 45, 'end': 55, 'lang': 'eng_Latn'}    # "(lougouwou)"
             ]),
@@ -48,13 +68,13 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "They need to treat the chest infection. Their blood pressure has risen a bit.",
             'annotated_translation': "They need to treat the chest infection. Their blood pressure has risen a bit.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 11, 'lang': 'hat_Latn'},
                 {'start': 12, 'end': 17, 'lang': 'fra_Latn'},  # "tonne" (French)
                 {'start': 18, 'end': 35, 'lang': 'hat_Latn'},
                 {'start': 36, 'end': 43, 'lang': 'eng_Latn'}   # "engist" (angoisse - French)
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 0, 'end': 49, 'lang': 'eng_Latn'}
             ]),
             'code_switch_type': 'french_injection',
@@ -72,11 +92,11 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "Doctor, don't forget to check on them this afternoon.",
             'annotated_translation': "Doctor, don't forget to check (examine) them this afternoon.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 16, 'lang': 'hat_Latn'},
                 {'start': 17, 'end': 22, 'lang': 'eng_Latn'}   # "check"
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 20, 'end': 25, 'lang': 'eng_Latn'},  # "check"
                 {'start': 26, 'end': 35, 'lang': 'eng_Latn'}   # "(examine)"
             ]),
@@ -95,12 +115,12 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "Please go pick up your medications from the pharmacy before you go home.",
             'annotated_translation': "Please go pick up (get/collect) your medications from the pharmacy before you go home.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 15, 'lang': 'hat_Latn'},
                 {'start': 16, 'end': 20, 'lang': 'eng_Latn'},  # "grab"
                 {'start': 21, 'end': 43, 'lang': 'hat_Latn'}
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 12, 'end': 17, 'lang': 'eng_Latn'},  # "pick"
                 {'start': 18, 'end': 35, 'lang': 'eng_Latn'}   # "(get/collect)"
             ]),
@@ -119,12 +139,12 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "We need to change the dressing before you leave.",
             'annotated_translation': "We need to change (fix/repair) the dressing before you leave.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 14, 'lang': 'hat_Latn'},
                 {'start': 15, 'end': 19, 'lang': 'eng_Latn'},  # "fix"
                 {'start': 20, 'end': 36, 'lang': 'hat_Latn'}
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 12, 'end': 19, 'lang': 'eng_Latn'},  # "change"
                 {'start': 20, 'end': 37, 'lang': 'eng_Latn'}   # "(fix/repair)"
             ]),
@@ -143,13 +163,13 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "I don't know but if you don't take your medications, you will get sick.",
             'annotated_translation': "I don't know but if you don't take your medications, you will get sick.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 14, 'lang': 'hat_Latn'},
                 {'start': 15, 'end': 22, 'lang': 'eng_Latn'},  # "but if"
                 {'start': 23, 'end': 25, 'lang': 'spa_Latn'},  # "si"
                 {'start': 26, 'end': 58, 'lang': 'hat_Latn'}
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 0, 'end': 60, 'lang': 'eng_Latn'}
             ]),
             'code_switch_type': 'mixed_systemic',
@@ -167,12 +187,12 @@ def create_code_switch_examples():
             'tgt_lang_primary': 'eng_Latn',
             'clean_translation': "The women don't walk well in that market.",
             'annotated_translation': "The women (bouzen = women/girls) don't walk well in that market.",
-            'src_lang_tags': json.dumps([
+            'src_lang_tags': _dumps([
                 {'start': 0, 'end': 8, 'lang': 'hat_Latn'},
                 {'start': 0, 'end': 6, 'lang': 'hat_Latn', 'slang': True},  # "bouzen"
                 {'start': 7, 'end': 28, 'lang': 'hat_Latn'}
             ]),
-            'tgt_lang_tags': json.dumps([
+            'tgt_lang_tags': _dumps([
                 {'start': 4, 'end': 9, 'lang': 'eng_Latn'},
                 {'start': 10, 'end': 33, 'lang': 'eng_Latn'},  # "(bouzen = women/girls)"
                 {'start': 34, 'end': 54, 'lang': 'eng_Latn'}
@@ -199,38 +219,28 @@ def insert_code_switch_examples(db_path: str):
 
     # Connect to database
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    rows = [tuple(example[col] for col in CODE_SWITCH_COLUMNS) for example in examples]
 
     try:
-        # Insert examples
-        for example in examples:
-            cursor.execute("""
-                INSERT OR REPLACE INTO code_switch_examples (
-                    id, src_text_mixed, src_lang_primary, tgt_lang_primary,
-                    clean_translation, annotated_translation, src_lang_tags,
-                    tgt_lang_tags, code_switch_type, domain, context,
-                    provenance, confidence
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                example['id'], example['src_text_mixed'], example['src_lang_primary'],
-                example['tgt_lang_primary'], example['clean_translation'],
-                example['annotated_translation'], example['src_lang_tags'],
-                example['tgt_lang_tags'], example['code_switch_type'],
-                example['domain'], example['context'], example['provenance'],
-                example['confidence']
-            ))
-
-        # Update metadata
-        cursor.execute("""
-            INSERT OR REPLACE INTO metadata (key, value, description, updated_at)
-            VALUES ('code_switch_count', ?, 'Total code-switching examples', datetime('now'))
-        """, (len(examples),))
-
-        conn.commit()
-        print("8"✅ Added {len(examples)} code-switching training examples"
+        # Insert all examples and the metadata update in one transaction
+        with conn:
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO code_switch_examples ({', '.join(CODE_SWITCH_COLUMNS)})
+                VALUES ({', '.join('?' * len(CODE_SWITCH_COLUMNS))})
+            """, rows)
+
+            # Update metadata
+            conn.execute("""
+                INSERT OR REPLACE INTO metadata (key, value, description, updated_at)
+                VALUES ('code_switch_count', ?, 'Total code-switching examples', datetime('now'))
+            """, (len(examples),))
+
+        print(f"✅ Added {len(examples)} code-switching training examples")
     except sqlite3.Error as e:
         print(f"❌ Failed to insert examples: {e}")
-        conn.rollback()
 
     finally:
         conn.close()
@@ -4,30 +4,48 @@ Generate 3000+ parallel corpus entries with proper context JSON.
 Target: Reach practical minimum for effective LoRA training.
 """
 
+import argparse
 import csv
+import functools
+import gzip
 import json
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import cycle, islice
 from pathlib import Path
 
+CORPUS_COLUMNS = ['id', 'src_text', 'src_lang', 'tgt_text_literal', 'tgt_text_localized',
+                  'tgt_lang', 'domain', 'is_idiom', 'contains_dosage', 'context',
+                  'cultural_note', 'provenance', 'curation_status']
+
+# Keys of the make_context JSON, stored as a struct column in Parquet output
+CONTEXT_FIELDS = ['speaker_role', 'audience', 'register', 'region', 'formality', 'sensitivity']
+
+# Below this many total rows the batches are generated serially; pool
+# start-up and pickling cost more than the generation itself
+PARALLEL_MIN_ROWS = 50_000
+
 def generate_corpus_batches():
     """Generate comprehensive medical corpus in specialty batches."""
+    return dict(iter_corpus_batches())
+
+def iter_corpus_batches():
+    """Yield (specialty, entries) pairs in output order.
     
-    batches = {
-        'emergency': generate_emergency_batch(400),
-        'pediatrics': generate_pediatrics_batch(400),
-        'obstetrics': generate_obstetrics_batch(400),
-        'cardiology': generate_cardiology_batch(350),
-        'diabetes': generate_diabetes_batch(350),
-        'mental_health': generate_mental_health_batch(300),
-        'infectious': generate_infectious_batch(300),
-        'pharmacy': generate_pharmacy_batch(300),
-        'preventive': generate_preventive_batch(200),
-        'dental': generate_dental_batch(150),
-        'dermatology': generate_dermatology_batch(150),
-        'neurology': generate_neurology_batch(200),
-    }
-    
-    return batches
+    The specialty generators share no state, so large runs (PARALLEL_MIN_ROWS
+    or more) use a process pool; smaller ones are generated serially.
+    """
+    if sum(spec['count'] for spec in SPECIALTIES) < PARALLEL_MIN_ROWS:
+        yield from map(_run_spec, SPECIALTIES)
+        return
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_run_spec, SPECIALTIES)
+
+def _run_spec(spec):
+    """Generate one SPECIALTIES entry in a worker process."""
+    return spec['key'], list(_generate(spec))
 
+@functools.lru_cache(maxsize=128)
 def make_context(speaker='doctor', audience='patient', register='neutral', region='General', sensitivity='low'):
     """Create context JSON for corpus entry."""
     return json.dumps({
@@ -39,376 +57,307 @@ def make_context(speaker='doctor', audience='patient', register='neutral', regio
         'sensitivity': sensitivity
     })
 
-def generate_emergency_batch(count):
-    """Generate emergency medicine corpus entries."""
-    templates = [
-        # Triage and Assessment
-        ("Are you in pain", "Èske ou gen doulè", "Èske w ap soufri", "neutral", "low"),
-        ("On a scale of 1 to 10 how bad is your pain", "Sou yon echèl 1 a 10 konbyen doulè a", "Si 1 pa fè mal epi 10 fè mal anpil konbyen doulè w ye", "neutral", "low"),
-        ("When did this start", "Kilè sa te kòmanse", "Depi kilè sa rive w", "neutral", "low"),
-        ("Have you ever had this before", "Èske sa te janm rive w anvan", "Èske w te deja gen sa", "neutral", "low"),
-        ("Are you taking any medications", "Èske w ap pran medikaman", "Èske w ap pran renmèd", "neutral", "low"),
-        ("Do you have any allergies", "Èske w gen alèji", "Èske gen bagay ki fè w alèji", "neutral", "low"),
-        ("Can you walk", "Èske w ka mache", "Èske w ka kanpe", "neutral", "low"),
-        ("Do you feel dizzy", "Èske w santi w toudi", "Èske tèt w ap vire", "neutral", "low"),
-        ("Are you having trouble breathing", "Èske w gen difikilte pou respire", "Èske w ap soufle kout", "neutral", "high"),
-        ("Is the pain getting worse", "Èske doulè a ap vin pi mal", "Èske doulè a ap ogmante", "neutral", "medium"),
-        
-        # Critical Symptoms
-        ("You need immediate medical attention", "Ou bezwen atansyon medikal imedyat", "Ou bezwen wè doktè touswit", "formal", "high"),
-        ("This is an emergency", "Sa a se yon ijans", "Sa a se ijans", "formal", "high"),
-        ("We need to call an ambulance", "Nou bezwen rele yon anbilans", "Nou pral rele anbilans", "formal", "high"),
-        ("You may be having a heart attack", "Ou ka ap fè yon atak kè", "Kè w ka ap fè w pwoblèm", "formal", "high"),
-        ("You may be having a stroke", "Ou ka ap fè yon atak serebral", "Ou ka fè yon atak", "formal", "high"),
-        ("Your blood pressure is dangerously high", "Tansyon ou danjere wo", "Tansyon ou twò wo anpil", "formal", "high"),
-        ("You are losing too much blood", "W ap pèdi twòp san", "W ap pèdi san anpil", "formal", "high"),
-        ("You need surgery right away", "Ou bezwen operasyon touswit", "Yo dwe opere w kounye a", "formal", "high"),
-        ("Stay still do not move", "Rete an plas pa bouje", "Pa bouje", "formal", "medium"),
-        ("Help is on the way", "Èd ap vini", "Èd ap rive", "formal", "medium"),
-    ]
+_EMERG_TEMPLATES = (
+    # Triage and Assessment
+    ("Are you in pain", "Èske ou gen doulè", "Èske w ap soufri", "neutral", "low"),
+    ("On a scale of 1 to 10 how bad is your pain", "Sou yon echèl 1 a 10 konbyen doulè a", "Si 1 pa fè mal epi 10 fè mal anpil konbyen doulè w ye", "neutral", "low"),
+    ("When did this start", "Kilè sa te kòmanse", "Depi kilè sa rive w", "neutral", "low"),
+    ("Have you ever had this before", "Èske sa te janm rive w anvan", "Èske w te deja gen sa", "neutral", "low"),
+    ("Are you taking any medications", "Èske w ap pran medikaman", "Èske w ap pran renmèd", "neutral", "low"),
+    ("Do you have any allergies", "Èske w gen alèji", "Èske gen bagay ki fè w alèji", "neutral", "low"),
+    ("Can you walk", "Èske w ka mache", "Èske w ka kanpe", "neutral", "low"),
+    ("Do you feel dizzy", "Èske w santi w toudi", "Èske tèt w ap vire", "neutral", "low"),
+    ("Are you having trouble breathing", "Èske w gen difikilte pou respire", "Èske w ap soufle kout", "neutral", "high"),
+    ("Is the pain getting worse", "Èske doulè a ap vin pi mal", "Èske doulè a ap ogmante", "neutral", "medium"),
     
-    entries = []
-    base_id = 100
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_emerg_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Emergency medicine - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+    # Critical Symptoms
+    ("You need immediate medical attention", "Ou bezwen atansyon medikal imedyat", "Ou bezwen wè doktè touswit", "formal", "high"),
+    ("This is an emergency", "Sa a se yon ijans", "Sa a se ijans", "formal", "high"),
+    ("We need to call an ambulance", "Nou bezwen rele yon anbilans", "Nou pral rele anbilans", "formal", "high"),
+    ("You may be having a heart attack", "Ou ka ap fè yon atak kè", "Kè w ka ap fè w pwoblèm", "formal", "high"),
+    ("You may be having a stroke", "Ou ka ap fè yon atak serebral", "Ou ka fè yon atak", "formal", "high"),
+    ("Your blood pressure is dangerously high", "Tansyon ou danjere wo", "Tansyon ou twò wo anpil", "formal", "high"),
+    ("You are losing too much blood", "W ap pèdi twòp san", "W ap pèdi san anpil", "formal", "high"),
+    ("You need surgery right away", "Ou bezwen operasyon touswit", "Yo dwe opere w kounye a", "formal", "high"),
+    ("Stay still do not move", "Rete an plas pa bouje", "Pa bouje", "formal", "medium"),
+    ("Help is on the way", "Èd ap vini", "Èd ap rive", "formal", "medium"),
+)
 
-def generate_pediatrics_batch(count):
-    """Generate pediatrics corpus entries."""
-    templates = [
-        ("How old is your child", "Ki laj pitit ou", "Konbyen an pitit ou genyen", "neutral", "low"),
-        ("Is your child eating normally", "Èske pitit ou ap manje nòmalman", "Èske ti moun nan ap manje", "neutral", "low"),
-        ("Is your child drinking enough", "Èske pitit ou ap bwè ase", "Èske li ap bwè dlo", "neutral", "low"),
-        ("Your child has a fever", "Pitit ou gen lafyèv", "Tibebe a gen lafyèv", "neutral", "low"),
-        ("Give your child plenty of fluids", "Bay pitit ou anpil likid", "Fè li bwè anpil dlo", "neutral", "low"),
-        ("Your child needs to see a pediatrician", "Pitit ou bezwen wè yon pedyat", "Mennen li kay doktè timoun", "neutral", "low"),
-        ("This is common in children", "Sa a komen nan timoun", "Anpil timoun gen sa", "neutral", "low"),
-        ("Your baby is growing well", "Bebe ou ap grandi byen", "Bebe a ap devlope byen", "neutral", "low"),
-        ("Your child needs vaccines", "Pitit ou bezwen vaksen", "Li bezwen pran piki", "neutral", "low"),
-        ("Keep your child home from school", "Kenbe pitit ou lakay pa voye li lekòl", "Pa voye li lekòl jodi a", "neutral", "low"),
-    ]
-    
-    entries = []
-    base_id = 200
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('nurse', 'caregiver', reg, 'General', sens)
-        entries.append((
-            f"corp_ped_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Pediatrics - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_PED_TEMPLATES = (
+    ("How old is your child", "Ki laj pitit ou", "Konbyen an pitit ou genyen", "neutral", "low"),
+    ("Is your child eating normally", "Èske pitit ou ap manje nòmalman", "Èske ti moun nan ap manje", "neutral", "low"),
+    ("Is your child drinking enough", "Èske pitit ou ap bwè ase", "Èske li ap bwè dlo", "neutral", "low"),
+    ("Your child has a fever", "Pitit ou gen lafyèv", "Tibebe a gen lafyèv", "neutral", "low"),
+    ("Give your child plenty of fluids", "Bay pitit ou anpil likid", "Fè li bwè anpil dlo", "neutral", "low"),
+    ("Your child needs to see a pediatrician", "Pitit ou bezwen wè yon pedyat", "Mennen li kay doktè timoun", "neutral", "low"),
+    ("This is common in children", "Sa a komen nan timoun", "Anpil timoun gen sa", "neutral", "low"),
+    ("Your baby is growing well", "Bebe ou ap grandi byen", "Bebe a ap devlope byen", "neutral", "low"),
+    ("Your child needs vaccines", "Pitit ou bezwen vaksen", "Li bezwen pran piki", "neutral", "low"),
+    ("Keep your child home from school", "Kenbe pitit ou lakay pa voye li lekòl", "Pa voye li lekòl jodi a", "neutral", "low"),
+)
 
-def generate_obstetrics_batch(count):
-    """Generate obstetrics/gynecology corpus entries."""
-    templates = [
-        ("Are you pregnant", "Èske w ansent", "Èske w gen vant", "neutral", "low"),
-        ("When was your last period", "Kilè dènye regl ou", "Kilè w te wè regl ou dènye fwa", "neutral", "low"),
-        ("How many months pregnant are you", "Konbyen mwa w gen", "Vant ou gen konbyen mwa", "neutral", "low"),
-        ("Do you feel the baby moving", "Èske w santi bebe a ap bouje", "Èske w santi li", "neutral", "low"),
-        ("Your baby is healthy", "Bebe ou an sante", "Bebe a byen", "neutral", "low"),
-        ("You need prenatal vitamins", "Ou bezwen vitamin pou gwosès", "Pran vitamin pou fanm ansent", "neutral", "low"),
-        ("Avoid alcohol during pregnancy", "Evite alkòl pandan gwosès", "Pa bwè alkòl pandan w gen vant", "formal", "medium"),
-        ("You are in labor", "W ap akouche", "Bebe a ap sòti", "neutral", "medium"),
-        ("Push when I tell you", "Pouse lè m di w", "Pouse kounye a", "neutral", "medium"),
-        ("The baby is coming", "Bebe a ap vini", "Bebe a preske sòti", "neutral", "medium"),
-    ]
-    
-    entries = []
-    base_id = 300
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('nurse', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_ob_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Obstetrics - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_OB_TEMPLATES = (
+    ("Are you pregnant", "Èske w ansent", "Èske w gen vant", "neutral", "low"),
+    ("When was your last period", "Kilè dènye regl ou", "Kilè w te wè regl ou dènye fwa", "neutral", "low"),
+    ("How many months pregnant are you", "Konbyen mwa w gen", "Vant ou gen konbyen mwa", "neutral", "low"),
+    ("Do you feel the baby moving", "Èske w santi bebe a ap bouje", "Èske w santi li", "neutral", "low"),
+    ("Your baby is healthy", "Bebe ou an sante", "Bebe a byen", "neutral", "low"),
+    ("You need prenatal vitamins", "Ou bezwen vitamin pou gwosès", "Pran vitamin pou fanm ansent", "neutral", "low"),
+    ("Avoid alcohol during pregnancy", "Evite alkòl pandan gwosès", "Pa bwè alkòl pandan w gen vant", "formal", "medium"),
+    ("You are in labor", "W ap akouche", "Bebe a ap sòti", "neutral", "medium"),
+    ("Push when I tell you", "Pouse lè m di w", "Pouse kounye a", "neutral", "medium"),
+    ("The baby is coming", "Bebe a ap vini", "Bebe a preske sòti", "neutral", "medium"),
+)
 
-def generate_cardiology_batch(count):
-    """Generate cardiology corpus entries."""
-    templates = [
-        ("You have high blood pressure", "Ou gen tansyon wo", "Ou gen tansyon", "neutral", "medium"),
-        ("Your heart rate is irregular", "Ritm kè ou pa regilye", "Kè w ap bat pa nòmal", "neutral", "medium"),
-        ("You need to reduce salt intake", "Ou bezwen redui sèl", "Manje mwens sèl", "neutral", "low"),
-        ("Exercise regularly", "Fè egzèsis regilyèman", "Fè egzèsis souvan", "neutral", "low"),
-        ("Take your blood pressure medicine daily", "Pran medikaman tansyon ou chak jou", "Pran renmèd tansyon ou chak jou", "neutral", "medium"),
-        ("This medication prevents blood clots", "Medikaman sa a anpeche san koagile", "Renmèd sa a anpeche san w fè grimo", "formal", "medium"),
-        ("You may need a stent", "Ou ka bezwen yon stent", "Ou ka bezwen yon ti tib nan kè w", "formal", "medium"),
-        ("Your cholesterol is high", "Kolestewòl ou wo", "Ou gen twòp gres nan san", "neutral", "low"),
-        ("Avoid fatty foods", "Evite manje gra", "Pa manje bagay ki gen anpil gres", "neutral", "low"),
-        ("You are at risk for heart disease", "Ou an risk pou maladi kè", "Kè w ka fè w pwoblèm", "formal", "medium"),
-    ]
-    
-    entries = []
-    base_id = 400
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_card_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Cardiology - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_CARD_TEMPLATES = (
+    ("You have high blood pressure", "Ou gen tansyon wo", "Ou gen tansyon", "neutral", "medium"),
+    ("Your heart rate is irregular", "Ritm kè ou pa regilye", "Kè w ap bat pa nòmal", "neutral", "medium"),
+    ("You need to reduce salt intake", "Ou bezwen redui sèl", "Manje mwens sèl", "neutral", "low"),
+    ("Exercise regularly", "Fè egzèsis regilyèman", "Fè egzèsis souvan", "neutral", "low"),
+    ("Take your blood pressure medicine daily", "Pran medikaman tansyon ou chak jou", "Pran renmèd tansyon ou chak jou", "neutral", "medium"),
+    ("This medication prevents blood clots", "Medikaman sa a anpeche san koagile", "Renmèd sa a anpeche san w fè grimo", "formal", "medium"),
+    ("You may need a stent", "Ou ka bezwen yon stent", "Ou ka bezwen yon ti tib nan kè w", "formal", "medium"),
+    ("Your cholesterol is high", "Kolestewòl ou wo", "Ou gen twòp gres nan san", "neutral", "low"),
+    ("Avoid fatty foods", "Evite manje gra", "Pa manje bagay ki gen anpil gres", "neutral", "low"),
+    ("You are at risk for heart disease", "Ou an risk pou maladi kè", "Kè w ka fè w pwoblèm", "formal", "medium"),
+)
 
-def generate_diabetes_batch(count):
-    """Generate diabetes/endocrinology corpus entries."""
-    templates = [
-        ("You have diabetes", "Ou gen dyabèt", "Ou gen sik", "neutral", "medium"),
-        ("Your blood sugar is too high", "Sik nan san ou twò wo", "Ou gen twòp sik", "neutral", "medium"),
-        ("Check your blood sugar daily", "Tcheke sik ou chak jou", "Mezire sik ou chak jou", "neutral", "low"),
-        ("Take insulin before meals", "Pran enslin anvan manje", "Pran piki a anvan w manje", "neutral", "medium"),
-        ("Avoid sugary foods", "Evite manje ki gen sik", "Pa manje bagay ki dous", "neutral", "low"),
-        ("Eat more vegetables", "Manje plis legim", "Manje anpil legim", "neutral", "low"),
-        ("Check your feet daily", "Gade pye ou chak jou", "Tcheke pye ou chak jou", "neutral", "low"),
-        ("Your vision may be affected", "Vizyon ou ka afekte", "Sik la ka fè w pa wè byen", "formal", "medium"),
-        ("You need to lose weight", "Ou bezwen pèdi pwa", "Ou bezwen vin pi mèg", "neutral", "low"),
-        ("Exercise helps control diabetes", "Egzèsis ede kontwole dyabèt", "Fè egzèsis pou kontwole sik", "neutral", "low"),
-    ]
-    
-    entries = []
-    base_id = 500
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_diab_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Diabetes/Endocrinology - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_DIAB_TEMPLATES = (
+    ("You have diabetes", "Ou gen dyabèt", "Ou gen sik", "neutral", "medium"),
+    ("Your blood sugar is too high", "Sik nan san ou twò wo", "Ou gen twòp sik", "neutral", "medium"),
+    ("Check your blood sugar daily", "Tcheke sik ou chak jou", "Mezire sik ou chak jou", "neutral", "low"),
+    ("Take insulin before meals", "Pran enslin anvan manje", "Pran piki a anvan w manje", "neutral", "medium"),
+    ("Avoid sugary foods", "Evite manje ki gen sik", "Pa manje bagay ki dous", "neutral", "low"),
+    ("Eat more vegetables", "Manje plis legim", "Manje anpil legim", "neutral", "low"),
+    ("Check your feet daily", "Gade pye ou chak jou", "Tcheke pye ou chak jou", "neutral", "low"),
+    ("Your vision may be affected", "Vizyon ou ka afekte", "Sik la ka fè w pa wè byen", "formal", "medium"),
+    ("You need to lose weight", "Ou bezwen pèdi pwa", "Ou bezwen vin pi mèg", "neutral", "low"),
+    ("Exercise helps control diabetes", "Egzèsis ede kontwole dyabèt", "Fè egzèsis pou kontwole sik", "neutral", "low"),
+)
 
-def generate_mental_health_batch(count):
-    """Generate mental health corpus entries."""
-    templates = [
-        ("How are you feeling", "Kijan w santi w", "Kòman ou ye", "neutral", "low"),
-        ("Do you feel sad", "Èske w santi w tris", "Èske w dekouraje", "neutral", "medium"),
-        ("Are you sleeping well", "Èske w ap dòmi byen", "Èske w ka dòmi", "neutral", "low"),
-        ("Do you have energy", "Èske w gen enèji", "Èske w santi w fatige", "neutral", "low"),
-        ("These feelings are normal", "Santiman sa yo nòmal", "Li nòmal pou santi konsa", "neutral", "low"),
-        ("You can get help", "Ou ka jwenn èd", "Gen moun ki ka ede w", "neutral", "low"),
-        ("Talking helps", "Pale ede", "Li bon pou pale ak yon moun", "neutral", "low"),
-        ("This medication may help", "Medikaman sa a ka ede", "Renmèd sa a ka fè w santi w pi byen", "neutral", "medium"),
-        ("Are you safe at home", "Èske w an sekirite lakay ou", "Èske w an sekirite", "formal", "high"),
-        ("Do you have thoughts of hurting yourself", "Èske w panse pou fè tèt ou mal", "Èske w panse pou fè w mal", "formal", "high"),
-    ]
-    
-    entries = []
-    base_id = 600
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_psych_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Mental Health - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_PSYCH_TEMPLATES = (
+    ("How are you feeling", "Kijan w santi w", "Kòman ou ye", "neutral", "low"),
+    ("Do you feel sad", "Èske w santi w tris", "Èske w dekouraje", "neutral", "medium"),
+    ("Are you sleeping well", "Èske w ap dòmi byen", "Èske w ka dòmi", "neutral", "low"),
+    ("Do you have energy", "Èske w gen enèji", "Èske w santi w fatige", "neutral", "low"),
+    ("These feelings are normal", "Santiman sa yo nòmal", "Li nòmal pou santi konsa", "neutral", "low"),
+    ("You can get help", "Ou ka jwenn èd", "Gen moun ki ka ede w", "neutral", "low"),
+    ("Talking helps", "Pale ede", "Li bon pou pale ak yon moun", "neutral", "low"),
+    ("This medication may help", "Medikaman sa a ka ede", "Renmèd sa a ka fè w santi w pi byen", "neutral", "medium"),
+    ("Are you safe at home", "Èske w an sekirite lakay ou", "Èske w an sekirite", "formal", "high"),
+    ("Do you have thoughts of hurting yourself", "Èske w panse pou fè tèt ou mal", "Èske w panse pou fè w mal", "formal", "high"),
+)
 
-def generate_infectious_batch(count):
-    """Generate infectious disease corpus entries."""
-    templates = [
-        ("You have an infection", "Ou gen yon enfeksyon", "Ou gen mikwòb", "neutral", "low"),
-        ("This is contagious", "Sa a kontajye", "Sa a ka pase bay lòt moun", "neutral", "medium"),
-        ("Take all your antibiotics", "Pran tout antibyotik yo", "Fini tout renmèd la", "formal", "medium"),
-        ("Cover your mouth when you cough", "Kouvri bouch ou lè w touse", "Mete men w sou bouch ou lè w touse", "neutral", "low"),
-        ("Wash your hands frequently", "Lave men ou souvan", "Lave men ou anpil", "neutral", "low"),
-        ("Stay home until you feel better", "Rete lakay jiskaske w santi w pi byen", "Rete lakay", "neutral", "medium"),
-        ("You need to be tested", "Ou bezwen fè tès", "Nou pral teste w", "neutral", "low"),
-        ("The test results are back", "Rezilta tès yo tounen", "Nou jwenn rezilta yo", "neutral", "low"),
-        ("You tested positive", "Tès ou pozitif", "Ou gen maladi a", "neutral", "medium"),
-        ("Drink plenty of fluids", "Bwè anpil likid", "Bwè dlo anpil", "neutral", "low"),
-    ]
-    
-    entries = []
-    base_id = 700
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('nurse', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_infect_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Infectious Disease - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_INFECT_TEMPLATES = (
+    ("You have an infection", "Ou gen yon enfeksyon", "Ou gen mikwòb", "neutral", "low"),
+    ("This is contagious", "Sa a kontajye", "Sa a ka pase bay lòt moun", "neutral", "medium"),
+    ("Take all your antibiotics", "Pran tout antibyotik yo", "Fini tout renmèd la", "formal", "medium"),
+    ("Cover your mouth when you cough", "Kouvri bouch ou lè w touse", "Mete men w sou bouch ou lè w touse", "neutral", "low"),
+    ("Wash your hands frequently", "Lave men ou souvan", "Lave men ou anpil", "neutral", "low"),
+    ("Stay home until you feel better", "Rete lakay jiskaske w santi w pi byen", "Rete lakay", "neutral", "medium"),
+    ("You need to be tested", "Ou bezwen fè tès", "Nou pral teste w", "neutral", "low"),
+    ("The test results are back", "Rezilta tès yo tounen", "Nou jwenn rezilta yo", "neutral", "low"),
+    ("You tested positive", "Tès ou pozitif", "Ou gen maladi a", "neutral", "medium"),
+    ("Drink plenty of fluids", "Bwè anpil likid", "Bwè dlo anpil", "neutral", "low"),
+)
 
-def generate_pharmacy_batch(count):
-    """Generate pharmacy instruction corpus entries."""
-    templates = [
-        ("Take one tablet twice daily", "Pran yon grenn de fwa pa jou", "Pran yon grenn nan maten epi yon lè aswè", "formal", "low"),
-        ("Take with food", "Pran ak manje", "Pran lè w ap manje", "neutral", "low"),
-        ("Do not crush or chew", "Pa kraze oswa moulen", "Vale li antye", "formal", "low"),
-        ("Store in a cool dry place", "Kenbe nan yon kote frè epi sèk", "Kenbe li nan yon kote ki pa cho", "formal", "low"),
-        ("Keep out of reach of children", "Kenbe lwen timoun", "Pa kite timoun jwenn li", "formal", "medium"),
-        ("Take until finished", "Pran jiskaske li fini", "Fini tout renmèd la", "formal", "medium"),
-        ("May cause drowsiness", "Ka fè w gen dòmi", "Ka fè w somnole", "formal", "low"),
-        ("Do not drink alcohol with this", "Pa bwè alkòl ak sa", "Pa bwè alkòl lè w pran li", "formal", "medium"),
-        ("Shake well before use", "Souke byen anvan itilize", "Souke li byen anvan w pran li", "formal", "low"),
-        ("Take on an empty stomach", "Pran sou yon vant vid", "Pran li anvan w manje", "formal", "low"),
-    ]
-    
-    entries = []
-    base_id = 800
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('pharmacist', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_pharm_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Pharmacy - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_PHARM_TEMPLATES = (
+    ("Take one tablet twice daily", "Pran yon grenn de fwa pa jou", "Pran yon grenn nan maten epi yon lè aswè", "formal", "low"),
+    ("Take with food", "Pran ak manje", "Pran lè w ap manje", "neutral", "low"),
+    ("Do not crush or chew", "Pa kraze oswa moulen", "Vale li antye", "formal", "low"),
+    ("Store in a cool dry place", "Kenbe nan yon kote frè epi sèk", "Kenbe li nan yon kote ki pa cho", "formal", "low"),
+    ("Keep out of reach of children", "Kenbe lwen timoun", "Pa kite timoun jwenn li", "formal", "medium"),
+    ("Take until finished", "Pran jiskaske li fini", "Fini tout renmèd la", "formal", "medium"),
+    ("May cause drowsiness", "Ka fè w gen dòmi", "Ka fè w somnole", "formal", "low"),
+    ("Do not drink alcohol with this", "Pa bwè alkòl ak sa", "Pa bwè alkòl lè w pran li", "formal", "medium"),
+    ("Shake well before use", "Souke byen anvan itilize", "Souke li byen anvan w pran li", "formal", "low"),
+    ("Take on an empty stomach", "Pran sou yon vant vid", "Pran li anvan w manje", "formal", "low"),
+)
 
-def generate_preventive_batch(count):
-    """Generate preventive care corpus entries."""
-    templates = [
-        ("Get a flu shot every year", "Pran vaksen grip chak ane", "Pran piki grip la chak ane", "neutral", "low"),
-        ("Exercise regularly", "Fè egzèsis regilyèman", "Fè egzèsis souvan", "neutral", "low"),
-        ("Eat a balanced diet", "Manje yon rejim balanse", "Manje byen", "neutral", "low"),
-        ("Quit smoking", "Sispann fimen", "Sispann fimen", "neutral", "low"),
-        ("Limit alcohol", "Limite alkòl", "Pa bwè twòp alkòl", "neutral", "low"),
-        ("Get enough sleep", "Dòmi ase", "Eseye dòmi ase", "neutral", "low"),
-        ("Wash your hands often", "Lave men ou souvan", "Lave men ou anpil", "neutral", "low"),
-        ("See your doctor regularly", "Wè doktè ou regilyèman", "Ale wè doktè souvan", "neutral", "low"),
-        ("Get screened for cancer", "Fè depistaj pou kansè", "Fè egzamen pou kansè", "formal", "low"),
-        ("Stay hydrated", "Rete idrate", "Bwè anpil dlo", "neutral", "low"),
-    ]
-    
-    entries = []
-    base_id = 900
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_prev_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Preventive Care - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_PREV_TEMPLATES = (
+    ("Get a flu shot every year", "Pran vaksen grip chak ane", "Pran piki grip la chak ane", "neutral", "low"),
+    ("Exercise regularly", "Fè egzèsis regilyèman", "Fè egzèsis souvan", "neutral", "low"),
+    ("Eat a balanced diet", "Manje yon rejim balanse", "Manje byen", "neutral", "low"),
+    ("Quit smoking", "Sispann fimen", "Sispann fimen", "neutral", "low"),
+    ("Limit alcohol", "Limite alkòl", "Pa bwè twòp alkòl", "neutral", "low"),
+    ("Get enough sleep", "Dòmi ase", "Eseye dòmi ase", "neutral", "low"),
+    ("Wash your hands often", "Lave men ou souvan", "Lave men ou anpil", "neutral", "low"),
+    ("See your doctor regularly", "Wè doktè ou regilyèman", "Ale wè doktè souvan", "neutral", "low"),
+    ("Get screened for cancer", "Fè depistaj pou kansè", "Fè egzamen pou kansè", "formal", "low"),
+    ("Stay hydrated", "Rete idrate", "Bwè anpil dlo", "neutral", "low"),
+)
 
-def generate_dental_batch(count):
-    """Generate dental care corpus entries."""
-    templates = [
-        ("You have a cavity", "Ou gen yon karyès", "Dan ou gen twou", "neutral", "low"),
-        ("You need a filling", "Ou bezwen yon plonbaj", "Nou pral bouche twou dan an", "neutral", "low"),
-        ("Brush twice daily", "Bwose de fwa pa jou", "Bwose dan ou nan maten epi lè aswè", "neutral", "low"),
-        ("Floss every day", "Itilize fil dantè chak jou", "Netwaye ant dan ou chak jou", "neutral", "low"),
-        ("This tooth needs to be pulled", "Dan sa a bezwen rache", "Nou dwe rache dan sa a", "formal", "medium"),
-        ("Your gums are swollen", "Jansiv ou anfle", "Jansiv ou anfle", "neutral", "low"),
-        ("Rinse with saltwater", "Rense ak dlo sale", "Gagari ak dlo sale", "neutral", "low"),
-        ("Avoid sugary foods", "Evite manje ki gen sik", "Pa manje bagay ki dous", "neutral", "low"),
-        ("This will numb your mouth", "Sa a pral angourdi bouch ou", "Bouch ou pap gen sans", "neutral", "low"),
-        ("See a dentist twice a year", "Wè yon dantis de fwa pa an", "Ale kay dantis de fwa chak ane", "neutral", "low"),
-    ]
-    
-    entries = []
-    base_id = 1000
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('dentist', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_dental_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Dental - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+_DENTAL_TEMPLATES = (
+    ("You have a cavity", "Ou gen yon karyès", "Dan ou gen twou", "neutral", "low"),
+    ("You need a filling", "Ou bezwen yon plonbaj", "Nou pral bouche twou dan an", "neutral", "low"),
+    ("Brush twice daily", "Bwose de fwa pa jou", "Bwose dan ou nan maten epi lè aswè", "neutral", "low"),
+    ("Floss every day", "Itilize fil dantè chak jou", "Netwaye ant dan ou chak jou", "neutral", "low"),
+    ("This tooth needs to be pulled", "Dan sa a bezwen rache", "Nou dwe rache dan sa a", "formal", "medium"),
+    ("Your gums are swollen", "Jansiv ou anfle", "Jansiv ou anfle", "neutral", "low"),
+    ("Rinse with saltwater", "Rense ak dlo sale", "Gagari ak dlo sale", "neutral", "low"),
+    ("Avoid sugary foods", "Evite manje ki gen sik", "Pa manje bagay ki dous", "neutral", "low"),
+    ("This will numb your mouth", "Sa a pral angourdi bouch ou", "Bouch ou pap gen sans", "neutral", "low"),
+    ("See a dentist twice a year", "Wè yon dantis de fwa pa an", "Ale kay dantis de fwa chak ane", "neutral", "low"),
+)
 
-def generate_dermatology_batch(count):
-    """Generate dermatology corpus entries."""
-    templates = [
-        ("You have a rash", "Ou gen yon gratèl", "Ou gen bouton", "neutral", "low"),
-        ("This is eczema", "Sa a se egzema", "Po w ap fè w grate", "neutral", "low"),
-        ("Apply cream twice daily", "Mete krèm de fwa pa jou", "Pase krèm sa a de fwa pa jou", "neutral", "low"),
-        ("Keep the area clean and dry", "Kenbe zòn nan pwòp epi sèk", "Lave kote a epi kenbe li sèk", "neutral", "low"),
-        ("Avoid scratching", "Evite grate", "Pa grate li", "neutral", "low"),
-        ("Protect from sun", "Pwoteje kont solèy", "Pa kite solèy la brile po w", "neutral", "low"),
-        ("Use sunscreen", "Itilize krèm solèy", "Mete krèm sou po w anvan w sòti", "neutral", "low"),
-        ("This may be an allergy", "Sa a ka yon alèji", "Sa a ka sòti akòz w alèji", "neutral", "low"),
-        ("The rash will clear up", "Gratèl la ap disparèt", "Bouton yo ap pase", "neutral", "low"),
-        ("This mole should be checked", "Mòl sa a ta dwe tcheke", "Nou dwe gade mòl sa a", "formal", "medium"),
-    ]
-    
-    entries = []
-    base_id = 1100
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_derm_{base_id + i:04d}",
+_DERM_TEMPLATES = (
+    ("You have a rash", "Ou gen yon gratèl", "Ou gen bouton", "neutral", "low"),
+    ("This is eczema", "Sa a se egzema", "Po w ap fè w grate", "neutral", "low"),
+    ("Apply cream twice daily", "Mete krèm de fwa pa jou", "Pase krèm sa a de fwa pa jou", "neutral", "low"),
+    ("Keep the area clean and dry", "Kenbe zòn nan pwòp epi sèk", "Lave kote a epi kenbe li sèk", "neutral", "low"),
+    ("Avoid scratching", "Evite grate", "Pa grate li", "neutral", "low"),
+    ("Protect from sun", "Pwoteje kont solèy", "Pa kite solèy la brile po w", "neutral", "low"),
+    ("Use sunscreen", "Itilize krèm solèy", "Mete krèm sou po w anvan w sòti", "neutral", "low"),
+    ("This may be an allergy", "Sa a ka yon alèji", "Sa a ka sòti akòz w alèji", "neutral", "low"),
+    ("The rash will clear up", "Gratèl la ap disparèt", "Bouton yo ap pase", "neutral", "low"),
+    ("This mole should be checked", "Mòl sa a ta dwe tcheke", "Nou dwe gade mòl sa a", "formal", "medium"),
+)
+
+_NEURO_TEMPLATES = (
+    ("Do you have headaches", "Èske w gen tèt fè mal", "Èske tèt ou ap fè w mal", "neutral", "low"),
+    ("Have you had a seizure", "Èske w te fè yon kriz", "Èske w te fè kadik", "formal", "medium"),
+    ("Do you feel dizzy", "Èske w santi w toudi", "Èske tèt w ap vire", "neutral", "low"),
+    ("Can you raise both arms", "Èske w ka leve tou de bra", "Leve de men ou", "formal", "medium"),
+    ("Can you smile", "Èske w ka souri", "Souri ban mwen", "neutral", "low"),
+    ("Is your vision blurry", "Èske vizyon ou flou", "Èske w ap wè byen", "neutral", "low"),
+    ("Do you have numbness", "Èske w gen angoudisman", "Èske gen pati ki pa gen sans", "neutral", "low"),
+    ("You may have had a stroke", "Ou ka te fè yon atak", "Ou ka te fè atak", "formal", "high"),
+    ("We need to do a CT scan", "Nou bezwen fè yon CT scan", "Nou pral pran foto sèvo ou", "formal", "medium"),
+    ("Take this medication for seizures", "Pran medikaman sa a pou kriz", "Pran renmèd sa a pou anpeche kadik", "formal", "medium"),
+)
+
+# Per-specialty generation parameters, in output order
+SPECIALTIES = [
+    {'key': 'emergency', 'id_prefix': 'corp_emerg_', 'base_id': 100, 'count': 400,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Emergency medicine', 'templates': _EMERG_TEMPLATES},
+    {'key': 'pediatrics', 'id_prefix': 'corp_ped_', 'base_id': 200, 'count': 400,
+     'speaker': 'nurse', 'audience': 'caregiver', 'note': 'Pediatrics', 'templates': _PED_TEMPLATES},
+    {'key': 'obstetrics', 'id_prefix': 'corp_ob_', 'base_id': 300, 'count': 400,
+     'speaker': 'nurse', 'audience': 'patient', 'note': 'Obstetrics', 'templates': _OB_TEMPLATES},
+    {'key': 'cardiology', 'id_prefix': 'corp_card_', 'base_id': 400, 'count': 350,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Cardiology', 'templates': _CARD_TEMPLATES},
+    {'key': 'diabetes', 'id_prefix': 'corp_diab_', 'base_id': 500, 'count': 350,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Diabetes/Endocrinology', 'templates': _DIAB_TEMPLATES},
+    {'key': 'mental_health', 'id_prefix': 'corp_psych_', 'base_id': 600, 'count': 300,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Mental Health', 'templates': _PSYCH_TEMPLATES},
+    {'key': 'infectious', 'id_prefix': 'corp_infect_', 'base_id': 700, 'count': 300,
+     'speaker': 'nurse', 'audience': 'patient', 'note': 'Infectious Disease', 'templates': _INFECT_TEMPLATES},
+    {'key': 'pharmacy', 'id_prefix': 'corp_pharm_', 'base_id': 800, 'count': 300,
+     'speaker': 'pharmacist', 'audience': 'patient', 'note': 'Pharmacy', 'templates': _PHARM_TEMPLATES},
+    {'key': 'preventive', 'id_prefix': 'corp_prev_', 'base_id': 900, 'count': 200,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Preventive Care', 'templates': _PREV_TEMPLATES},
+    {'key': 'dental', 'id_prefix': 'corp_dental_', 'base_id': 1000, 'count': 150,
+     'speaker': 'dentist', 'audience': 'patient', 'note': 'Dental', 'templates': _DENTAL_TEMPLATES},
+    {'key': 'dermatology', 'id_prefix': 'corp_derm_', 'base_id': 1100, 'count': 150,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Dermatology', 'templates': _DERM_TEMPLATES},
+    {'key': 'neurology', 'id_prefix': 'corp_neuro_', 'base_id': 1200, 'count': 200,
+     'speaker': 'doctor', 'audience': 'patient', 'note': 'Neurology', 'templates': _NEURO_TEMPLATES},
+]
+
+def _generate(spec):
+    """Yield corpus rows for one SPECIALTIES entry."""
+    templates = spec['templates']
+    base_id = spec['base_id']
+    id_fmt = f"{spec['id_prefix']}{{:04d}}".format
+    ctx_cache = {
+        (reg, sens): make_context(spec['speaker'], spec['audience'], reg, 'General', sens)
+        for (_, _, _, reg, sens) in templates
+    }
+    notes = {reg: f"{spec['note']} - {reg} register" for (_, _, _, reg, _) in templates}
+    yield from (
+        (
+            id_fmt(base_id + i),
             en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Dermatology - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+            0, 0, ctx_cache[(reg, sens)], notes[reg], "seed_data", "draft"
+        )
+        for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(islice(cycle(templates), spec['count']))
+    )
 
-def generate_neurology_batch(count):
-    """Generate neurology corpus entries."""
-    templates = [
-        ("Do you have headaches", "Èske w gen tèt fè mal", "Èske tèt ou ap fè w mal", "neutral", "low"),
-        ("Have you had a seizure", "Èske w te fè yon kriz", "Èske w te fè kadik", "formal", "medium"),
-        ("Do you feel dizzy", "Èske w santi w toudi", "Èske tèt w ap vire", "neutral", "low"),
-        ("Can you raise both arms", "Èske w ka leve tou de bra", "Leve de men ou", "formal", "medium"),
-        ("Can you smile", "Èske w ka souri", "Souri ban mwen", "neutral", "low"),
-        ("Is your vision blurry", "Èske vizyon ou flou", "Èske w ap wè byen", "neutral", "low"),
-        ("Do you have numbness", "Èske w gen angoudisman", "Èske gen pati ki pa gen sans", "neutral", "low"),
-        ("You may have had a stroke", "Ou ka te fè yon atak", "Ou ka te fè atak", "formal", "high"),
-        ("We need to do a CT scan", "Nou bezwen fè yon CT scan", "Nou pral pran foto sèvo ou", "formal", "medium"),
-        ("Take this medication for seizures", "Pran medikaman sa a pou kriz", "Pran renmèd sa a pou anpeche kadik", "formal", "medium"),
-    ]
+def context_struct(contexts):
+    """Convert context JSON strings to an Arrow struct of dictionary-encoded fields.
     
-    entries = []
-    base_id = 1200
-    for i, (en, ht_lit, ht_loc, reg, sens) in enumerate(templates * (count // len(templates) + 1)):
-        if len(entries) >= count:
-            break
-        ctx = make_context('doctor', 'patient', reg, 'General', sens)
-        entries.append((
-            f"corp_neuro_{base_id + i:04d}",
-            en, "eng_Latn", ht_lit, ht_loc, "hat_Latn", "medical",
-            0, 0, ctx, f"Neurology - {reg} register", "seed_data", "draft"
-        ))
-    return entries[:count]
+    Only a handful of distinct contexts exist, so each is parsed once.
+    """
+    import pyarrow as pa
+    
+    parsed = {ctx: json.loads(ctx) for ctx in set(contexts)}
+    field_type = pa.dictionary(pa.int8(), pa.string())
+    return pa.StructArray.from_arrays(
+        [pa.array([parsed[ctx][field] for ctx in contexts], type=field_type) for field in CONTEXT_FIELDS],
+        names=CONTEXT_FIELDS,
+    )
+
+@contextmanager
+def open_batch_sink(output_file, output_format='csv', compress=False):
+    """Open the output file and yield a function that writes a batch of rows."""
+    if output_format == 'parquet':
+        # Imported here so the default CSV path does not pay for pyarrow
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for --format parquet. "
+                "Please run: pip install pyarrow"
+            )
+        writer = None
+        
+        def write_rows(entries):
+            nonlocal writer
+            if not entries:
+                return
+            columns = dict(zip(CORPUS_COLUMNS, map(list, zip(*entries))))
+            columns['context'] = context_struct(columns['context'])
+            table = pa.table(columns)
+            if writer is None:
+                writer = pq.ParquetWriter(output_file, table.schema, compression='zstd')
+            writer.write_table(table)
+        
+        try:
+            yield write_rows
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        if compress:
+            stream = gzip.open(output_file, 'wt', compresslevel=1, encoding='utf-8', newline='')
+        else:
+            stream = open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+        with stream as f:
+            writer = csv.writer(f)
+            writer.writerow(CORPUS_COLUMNS)
+            yield writer.writerows
 
-def write_all_batches():
-    """Generate and write all corpus batches to file."""
+def write_all_batches(output_format='csv', compress=False):
+    """Generate and write all corpus batches to file.
+    
+    CSV is the default; 'parquet' writes a zstd-compressed Parquet file next
+    to it for direct columnar ingestion by the training pipeline, with
+    context stored as a struct rather than a JSON string. ``compress``
+    gzips the CSV output (level 1) to ``.csv.gz``.
+    """
     print("Generating comprehensive corpus batches...")
-    batches = generate_corpus_batches()
     
     output_file = Path(__file__).parent.parent / "data" / "seed" / "02_corpus_seed_BULK.csv"
+    if output_format == 'parquet':
+        output_file = output_file.with_suffix('.parquet')
+    elif compress:
+        output_file = output_file.with_name(output_file.name + '.gz')
     
     total_entries = 0
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        # Write header
-        writer.writerow(['id', 'src_text', 'src_lang', 'tgt_text_literal', 'tgt_text_localized', 
-                        'tgt_lang', 'domain', 'is_idiom', 'contains_dosage', 'context', 
-                        'cultural_note', 'provenance', 'curation_status'])
-        
-        # Write all batches
-        for specialty, entries in batches.items():
-            for row in entries:
-                writer.writerow(row)
-                total_entries += 1
-            print(f"  ✓ {specialty}: {len(entries)} entries")
+    seen = set()
+    with open_batch_sink(output_file, output_format, compress) as write_rows:
+        # Stream each batch to disk as soon as it is generated
+        for specialty, entries in iter_corpus_batches():
+            # Drop (src, literal, localized) triplets already emitted by an
+            # earlier specialty; repeats within a batch are intentional
+            unique = [row for row in entries if (row[1], row[3], row[4]) not in seen]
+            seen.update((row[1], row[3], row[4]) for row in entries)
+            write_rows(unique)
+            total_entries += len(unique)
+            dropped = len(entries) - len(unique)
+            dedup_note = f" ({dropped} cross-specialty duplicates dropped)" if dropped else ""
+            print(f"  ✓ {specialty}: {len(unique)} entries{dedup_note}")
     
     print(f"\n✓ Generated {total_entries} total corpus entries")
     print(f"  File: {output_file}")
@@ -418,5 +367,10 @@ def write_all_batches():
     return total_entries
 
 if __name__ == "__main__":
-    total = write_all_batches()
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--format', choices=('csv', 'parquet'), default='csv')
+    ap.add_argument('--compress', action='store_true', help='gzip the CSV output')
+    args = ap.parse_args()
+    
+    total = write_all_batches(args.format, args.compress)
     print(f"\nTarget reached: {total}/3000 entries ({total/3000*100:.1f}%)")
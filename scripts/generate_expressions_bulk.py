@@ -7,8 +7,12 @@ Usage:
 """
 import argparse
 import csv
+import functools
+import io
+import itertools
 from pathlib import Path
-from random import choice
+
+from _bulk_io import bulk_write, write_sharded
 
 BASE = [
     ("Dèyè mòn gen mòn", "Behind mountains there are mountains", "Challenges keep coming", "Pwoblèm pa janm fini", "neutral", "General"),
@@ -20,26 +24,36 @@ BASE = [
 REGIONS = ["General","Haiti-North","Haiti-South","Diaspora-US","Diaspora-Canada","Diaspora-France"]
 REGISTERS = ["formal","neutral","informal"]
 
+# Only 5 x 3 x 6 = 90 distinct rows exist, so walk them in order instead of sampling
+COMBOS = list(itertools.product(BASE, REGISTERS, REGIONS))
+
+# Counts above this are generated across a process pool
+PARALLEL_MIN_COUNT = 10_000
+
+FIELDNAMES = ['creole','literal_gloss_en','idiomatic_en','localized_ht','register','region','cultural_note']
+
+
+def synthesize(count:int, start:int=0):
+    """Yield expression rows as tuples in FIELDNAMES order, cycling through COMBOS."""
+    combos = itertools.islice(itertools.cycle(COMBOS), start % len(COMBOS), None)
+    for i, ((cre, lit, idio, ht, _, _), reg2, region2) in zip(range(start, start+count), combos):
+        # REGIONS is the innermost COMBOS axis, so key the tag on the outer
+        # position; i%3 would only ever tag two of the six regions
+        cre_var = cre if (i // len(REGIONS)) % 3 else cre + " (" + region2 + ")"
+        yield (cre_var, lit, idio, ht, reg2, region2, 'auto-generated; review')
+
+
+@functools.lru_cache(maxsize=None)
+def encode_row(row:tuple) -> bytes:
+    """CSV-quote and UTF-8 encode a row; rows come from a small fixed set, so cache them."""
+    buf = io.StringIO()
+    csv.writer(buf).writerow(row)
+    return buf.getvalue().encode('utf-8')
+
 
-def synthesize(count:int):
-    rows=[]
-    i=0
-    while len(rows)<count:
-        cre, lit, idio, ht, reg, region = choice(BASE)
-        reg2 = choice(REGISTERS)
-        region2 = choice(REGIONS)
-        cre_var = cre if i%3 else f"{cre} ({region2})"
-        rows.append({
-            'creole': cre_var,
-            'literal_gloss_en': lit,
-            'idiomatic_en': idio,
-            'localized_ht': ht,
-            'register': reg2,
-            'region': region2,
-            'cultural_note': 'auto-generated; review'
-        })
-        i+=1
-    return rows
+def shard_lines(count:int, start:int, seed:int):
+    """write_sharded block: rows start..start+count, so sharded output matches a serial run."""
+    return map(encode_row, synthesize(count, start))
 
 
 def main():
@@ -48,13 +62,12 @@ def main():
     ap.add_argument('--output', type=Path, default=Path('data/seed/03_expressions_bulk_300.csv'))
     args = ap.parse_args()
 
-    rows=synthesize(args.count)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with args.output.open('w', encoding="utf-8-sig", newline='') as f:
-        w=csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        w.writeheader()
-        w.writerows(rows)
-    print(f"✅ Wrote {len(rows)} expressions to {args.output}")
+    if args.count > PARALLEL_MIN_COUNT:
+        write_sharded(args.output, FIELDNAMES, shard_lines, args.count)
+    else:
+        bulk_write(args.output, FIELDNAMES, map(encode_row, synthesize(args.count)))
+    print(f"✅ Wrote {args.count} expressions to {args.output}")
 
 if __name__=='__main__':
     main()
@@ -7,9 +7,12 @@ Usage:
 """
 import argparse
 import csv
+import io
 import json
+import random
 from pathlib import Path
-from random import choice
+
+from _bulk_io import bulk_write, write_sharded
 
 TERMS = [
     ("tèt", ["head"], ["tèt la"], "anatomy"),
@@ -26,39 +29,80 @@ TERMS = [
 
 WEIGHTS = ["neutral","positive","negative","taboo"]
 
+# Counts above this are generated across a process pool
+PARALLEL_MIN_COUNT = 10_000
+
+FIELDNAMES = ['creole_canonical','english_equivalents','aliases','domain','cultural_weight',
+              'preferred_for_patients','examples_bad','examples_good','notes','created_by']
+
+# JSON-encoded list columns are constant per term, so encode them once
+TERMS_ENC = [
+    (cre, json.dumps(en, ensure_ascii=False), json.dumps(aliases, ensure_ascii=False), domain)
+    for cre, en, aliases, domain in TERMS
+]
+
+
+def _row(term, weight):
+    cre, en_json, aliases_json, domain = term
+    return (cre, en_json, aliases_json, domain, weight, '1', '', '',
+            'auto-generated; review', 'bulk_generator')
+
+
+def _build_templates():
+    """Render one UTF-8 CSV line per term with cultural_weight left as a %s slot.
 
-def synthesize(count:int):
-    rows=[]
-    for i in range(count):
-        cre,en,aliases,domain = choice(TERMS)
-        rows.append({
-            'creole_canonical': cre,
-            'english_equivalents': json.dumps(en, ensure_ascii=False),
-            'aliases': json.dumps(aliases, ensure_ascii=False),
-            'domain': domain,
-            'cultural_weight': choice(WEIGHTS),
-            'preferred_for_patients': 1,
-            'examples_bad': '',
-            'examples_good': '',
-            'notes': 'auto-generated; review',
-            'created_by': 'bulk_generator'
-        })
-    return rows
+    Quoting is done once here by csv.writer; every template is then checked
+    with a csv.reader round trip so the hot loop can skip the csv module.
+    """
+    templates = []
+    for term in TERMS_ENC:
+        buf = io.StringIO()
+        csv.writer(buf).writerow(_row(term, '\0'))
+        templates.append(buf.getvalue().replace('%', '%%').replace('\0', '%s'))
+    for term, template in zip(TERMS_ENC, templates):
+        for weight in WEIGHTS:
+            parsed = next(csv.reader(io.StringIO(template % weight)))
+            if tuple(parsed) != _row(term, weight):
+                raise ValueError(f"glossary row template does not round-trip: {template!r}")
+    return [template.encode('utf-8') for template in templates]
+
+
+TERM_TEMPLATES = _build_templates()
+WEIGHTS_ENC = [weight.encode('utf-8') for weight in WEIGHTS]
+
+
+def synthesize(count:int, rng=random):
+    """Yield finished UTF-8 CSV lines (CRLF-terminated) in FIELDNAMES order."""
+    templates = rng.choices(TERM_TEMPLATES, k=count)
+    weights = rng.choices(WEIGHTS_ENC, k=count)
+    for template, weight in zip(templates, weights):
+        yield template % weight
+
+
+def shard_lines(count:int, start:int, seed:int):
+    """write_sharded block: rows drawn from a Random seeded by the block id.
+
+    Blocks have a fixed size, so seeded output is the same on any core count.
+    """
+    return synthesize(count, random.Random(seed))
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--count', type=int, default=500)
     ap.add_argument('--output', type=Path, default=Path('data/seed/01_glossary_bulk_500.csv'))
+    ap.add_argument('--seed', type=int, default=None, help='fix the RNG seed for byte-identical reruns')
     args = ap.parse_args()
 
-    rows = synthesize(args.count)
+    rng = random.Random(args.seed)
+
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with args.output.open('w', encoding="utf-8-sig", newline='') as f:
-        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        w.writeheader()
-        w.writerows(rows)
-    print(f"✅ Wrote {len(rows)} glossary rows to {args.output}")
+    if args.count > PARALLEL_MIN_COUNT:
+        # Block seeds derive from this one, so --seed output is machine-independent
+        write_sharded(args.output, FIELDNAMES, shard_lines, args.count, rng.randrange(2**32))
+    else:
+        bulk_write(args.output, FIELDNAMES, synthesize(args.count, rng))
+    print(f"✅ Wrote {args.count} glossary rows to {args.output}")
 
 if __name__ == '__main__':
     main()
@@ -5,35 +5,56 @@ These entries require exact accuracy - dosages, procedures, triage, critical sym
 """
 
 import csv
+import io
 import json
+import re
 from pathlib import Path
 
+try:
+    import orjson  # Optional: C-backed JSON encoder
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize to compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
 def make_dosage_json(drug, dose_qty, dose_unit, frequency_hours=None, frequency_text=None, 
                      max_daily_dose=None, duration_days=None, route="oral"):
     """Create structured dosage JSON."""
+    optional = {
+        "frequency_hours": frequency_hours,
+        "frequency_text": frequency_text,
+        "max_daily_dose": max_daily_dose,
+        "duration_days": duration_days,
+    }
     dosage = {
         "drug": drug,
         "dose_qty": dose_qty,
         "dose_unit": dose_unit,
-        "route": route
+        "route": route,
+        **{k: v for k, v in optional.items() if v},
     }
-    if frequency_hours:
-        dosage["frequency_hours"] = frequency_hours
-    if frequency_text:
-        dosage["frequency_text"] = frequency_text
-    if max_daily_dose:
-        dosage["max_daily_dose"] = max_daily_dose
-    if duration_days:
-        dosage["duration_days"] = duration_days
-    return json.dumps(dosage)
+    return _dumps(dosage)
 
 def make_safety_flags(*flags):
-    """Create safety flags JSON list."""
-    return json.dumps(list(flags))
+    """Create safety flags JSON list.
 
-def generate_dosage_instructions():
-    """Generate medication dosage instructions (most critical)."""
-    entries = []
+    Flags are plain identifiers, so the JSON is assembled directly without
+    an encoder pass.
+    """
+    assert all('"' not in f and '\\' not in f for f in flags), flags
+    return '["' + '","'.join(flags) + '"]' if flags else '[]'
+
+# Flag sets shared by every row of a section, encoded once at import
+_SAFETY_DOSAGE_CRITICAL = make_safety_flags("requires_exact_dosage", "human_review_required", "critical_accuracy")
+_SAFETY_DOSAGE_VERIFY = make_safety_flags("requires_exact_dosage", "verify_prescription")
+
+def _build_dosage_instructions():
+    """Build the constant rows behind generate_dosage_instructions() once at import."""
     base_id = 1000
     
     # Common antibiotics
@@ -134,20 +155,22 @@ def generate_dosage_instructions():
     
     for i, (en, ht_lit, ht_loc, drug, qty, unit, freq_hrs, freq_txt, max_daily, duration) in enumerate(dosages):
         dosage_json = make_dosage_json(drug, qty, unit, freq_hrs, freq_txt, max_daily, duration)
-        safety_flags = make_safety_flags("requires_exact_dosage", "human_review_required", "critical_accuracy")
         
-        entries.append((
+        yield (
             f"hr_dosage_{base_id + i:04d}",
             en, ht_lit, ht_loc, 1, dosage_json, "dosage", "high",
-            safety_flags, 1, "seed_data",
+            _SAFETY_DOSAGE_CRITICAL, 1, "seed_data",
             f"Critical dosage instruction for {drug} - exact accuracy required"
-        ))
-    
-    return entries
+        )
 
-def generate_triage_instructions():
-    """Generate emergency triage instructions."""
-    entries = []
+_DOSAGE_ROWS = tuple(_build_dosage_instructions())
+
+def generate_dosage_instructions():
+    """Generate medication dosage instructions (most critical)."""
+    yield from _DOSAGE_ROWS
+
+def _build_triage_instructions():
+    """Build the constant rows behind generate_triage_instructions() once at import."""
     base_id = 2000
     
     instructions = [
@@ -204,18 +227,21 @@ def generate_triage_instructions():
     ]
     
     for i, (en, ht_lit, ht_loc, risk, flags) in enumerate(instructions):
-        entries.append((
+        yield (
             f"hr_triage_{base_id + i:04d}",
             en, ht_lit, ht_loc, 0, None, "triage", risk,
             flags, 1, "seed_data",
             f"Triage instruction - {risk} priority - requires clear communication"
-        ))
-    
-    return entries
+        )
 
-def generate_procedure_warnings():
-    """Generate critical procedure instructions and warnings."""
-    entries = []
+_TRIAGE_ROWS = tuple(_build_triage_instructions())
+
+def generate_triage_instructions():
+    """Generate emergency triage instructions."""
+    yield from _TRIAGE_ROWS
+
+def _build_procedure_warnings():
+    """Build the constant rows behind generate_procedure_warnings() once at import."""
     base_id = 3000
     
     procedures = [
@@ -271,18 +297,21 @@ def generate_procedure_warnings():
     ]
     
     for i, (en, ht_lit, ht_loc, risk, flags) in enumerate(procedures):
-        entries.append((
+        yield (
             f"hr_procedure_{base_id + i:04d}",
             en, ht_lit, ht_loc, 0, None, "procedure", risk,
             flags, 1, "seed_data",
             f"Critical procedure instruction - {risk} risk"
-        ))
-    
-    return entries
+        )
 
-def generate_symptom_warnings():
-    """Generate critical symptom recognition and response."""
-    entries = []
+_PROCEDURE_ROWS = tuple(_build_procedure_warnings())
+
+def generate_procedure_warnings():
+    """Generate critical procedure instructions and warnings."""
+    yield from _PROCEDURE_ROWS
+
+def _build_symptom_warnings():
+    """Build the constant rows behind generate_symptom_warnings() once at import."""
     base_id = 4000
     
     symptoms = [
@@ -338,18 +367,21 @@ def generate_symptom_warnings():
     ]
     
     for i, (en, ht_lit, ht_loc, risk, flags) in enumerate(symptoms):
-        entries.append((
+        yield (
             f"hr_symptom_{base_id + i:04d}",
             en, ht_lit, ht_loc, 0, None, "symptom", risk,
             flags, 1, "seed_data",
             f"Critical symptom warning - requires immediate recognition"
-        ))
-    
-    return entries
+        )
 
-def generate_additional_dosages():
-    """Generate more medication dosing to reach 500+ total."""
-    entries = []
+_SYMPTOM_ROWS = tuple(_build_symptom_warnings())
+
+def generate_symptom_warnings():
+    """Generate critical symptom recognition and response."""
+    yield from _SYMPTOM_ROWS
+
+def _build_additional_dosages():
+    """Build the constant rows behind generate_additional_dosages() once at import."""
     base_id = 5000
     
     # Expand with more common medications
@@ -397,67 +429,99 @@ def generate_additional_dosages():
         ("Take naproxen 500mg twice daily with food", "naproxen", 500, "mg", 12, "twice daily with food", 1000),
     ]
     
-    for i, data in enumerate(more_dosages):
-        if len(data) == 7:
-            en_base, drug, qty, unit, freq_hrs, freq_txt, max_daily = data
-            duration = None
-        else:
-            continue
-            
-        ht_lit = f"Pran {drug} {qty}{unit} {freq_txt}"
-        ht_loc = f"Pran {drug} {qty}{unit} jan doktè di w la"
-        
-        dosage_json = make_dosage_json(drug, qty, unit, freq_hrs, freq_txt, max_daily, duration)
-        safety_flags = make_safety_flags("requires_exact_dosage", "verify_prescription")
-        
-        entries.append((
+    return [
+        (
             f"hr_dosage_{base_id + i:04d}",
-            en_base, ht_lit, ht_loc, 1, dosage_json, "dosage", "high",
-            safety_flags, 1, "seed_data",
+            en_base, f"Pran {drug} {qty}{unit} {freq_txt}", f"Pran {drug} {qty}{unit} jan doktè di w la",
+            1, make_dosage_json(drug, qty, unit, freq_hrs, freq_txt, max_daily), "dosage", "high",
+            _SAFETY_DOSAGE_VERIFY, 1, "seed_data",
             f"Dosage instruction for {drug}"
-        ))
-    
-    return entries
+        )
+        for i, (en_base, drug, qty, unit, freq_hrs, freq_txt, max_daily) in enumerate(more_dosages)
+    ]
+
+_ADDITIONAL_DOSAGE_ROWS = tuple(_build_additional_dosages())
+
+def generate_additional_dosages():
+    """Generate more medication dosing to reach 500+ total."""
+    yield from _ADDITIONAL_DOSAGE_ROWS
+
+SECTIONS = (
+    ("Dosage instructions", generate_dosage_instructions),
+    ("Triage instructions", generate_triage_instructions),
+    ("Procedure warnings", generate_procedure_warnings),
+    ("Symptom warnings", generate_symptom_warnings),
+    ("Additional dosages", generate_additional_dosages),
+)
+
+
+# Header matching schema, pre-encoded for the binary writer
+HEADER = b'id,src_en,tgt_ht_literal,tgt_ht_localized,contains_dosage,dosage_json,' \
+         b'instruction_type,risk_level,safety_flags,require_human_review,provenance,notes\r\n'
+
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _quote_json(value):
+    """CSV-quote a JSON cell the way csv.writer does; None becomes an empty cell."""
+    if value is None:
+        return ''
+    if _NEEDS_QUOTING.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _fast_write(entries, out):
+    """Write rows to a binary stream exactly as csv.writer would, skipping its per-cell scan.
+
+    Only the two JSON columns are checked per cell; a row whose text
+    columns contain a delimiter, quote or newline falls back to csv.writer.
+    Lines are joined and UTF-8 encoded once per call.
+    """
+    lines = []
+    append = lines.append
+    spill = io.StringIO()
+    writer = csv.writer(spill)
+    needs_quoting = _NEEDS_QUOTING.search
+    for row in entries:
+        (entry_id, en, ht_lit, ht_loc, contains_dosage, dosage_json,
+         instruction_type, risk, safety_flags, review, provenance, notes) = row
+        if needs_quoting(f"{entry_id}{en}{ht_lit}{ht_loc}{instruction_type}{risk}{provenance}{notes}"):
+            writer.writerow(row)
+            append(spill.getvalue())
+            spill.seek(0)
+            spill.truncate()
+            continue
+        append(f"{entry_id},{en},{ht_lit},{ht_loc},{contains_dosage},{_quote_json(dosage_json)},"
+               f"{instruction_type},{risk},{_quote_json(safety_flags)},{review},{provenance},{notes}\r\n")
+    out.write(''.join(lines).encode('utf-8'))
+
 
 def write_all_high_risk():
     """Generate and write all high-risk entries."""
     print("Generating high-risk medical translations...")
     
-    all_entries = []
-    all_entries.extend(generate_dosage_instructions())
-    print(f"  ✓ Dosage instructions: {len(generate_dosage_instructions())} entries")
-    
-    all_entries.extend(generate_triage_instructions())
-    print(f"  ✓ Triage instructions: {len(generate_triage_instructions())} entries")
-    
-    all_entries.extend(generate_procedure_warnings())
-    print(f"  ✓ Procedure warnings: {len(generate_procedure_warnings())} entries")
-    
-    all_entries.extend(generate_symptom_warnings())
-    print(f"  ✓ Symptom warnings: {len(generate_symptom_warnings())} entries")
-    
-    all_entries.extend(generate_additional_dosages())
-    print(f"  ✓ Additional dosages: {len(generate_additional_dosages())} entries")
-    
     output_file = Path(__file__).parent.parent / "data" / "seed" / "04_high_risk_seed_BULK.csv"
+    total = dosage_entries = 0
     
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f)
-        # Write header matching schema
-        writer.writerow(['id', 'src_en', 'tgt_ht_literal', 'tgt_ht_localized', 'contains_dosage',
-                        'dosage_json', 'instruction_type', 'risk_level', 'safety_flags',
-                        'require_human_review', 'provenance', 'notes'])
-        
-        for row in all_entries:
-            writer.writerow(row)
+    # Section rows are frozen at import, so they are written serially;
+    # each section is written as soon as it is produced instead of collecting them all
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(HEADER)
+        for label, generate in SECTIONS:
+            section = list(generate())
+            _fast_write(section, f)
+            total += len(section)
+            dosage_entries += sum(1 for e in section if e[4] == 1)
+            print(f"  ✓ {label}: {len(section)} entries")
     
-    print(f"\n✓ Generated {len(all_entries)} total high-risk entries")
+    print(f"\n✓ Generated {total} total high-risk entries")
     print(f"  File: {output_file}")
     print(f"\n  CRITICAL: All entries marked for human review")
-    print(f"  Contains proper dosage_json for {sum(1 for e in all_entries if e[4] == 1)} medication entries")
-    print(f"  Target reached: {len(all_entries)}/500 entries ({len(all_entries)/500*100:.1f}%)")
+    print(f"  Contains proper dosage_json for {dosage_entries} medication entries")
+    print(f"  Target reached: {total}/500 entries ({total/500*100:.1f}%)")
     
-    return len(all_entries)
+    return total
 
 if __name__ == "__main__":
     total = write_all_high_risk()
@@ -8,9 +8,15 @@ Usage:
 """
 import argparse
 import csv
+import io
 import json
 from pathlib import Path
-from random import choice, randint
+from random import choices
+
+try:
+    import orjson  # Optional: C-backed JSON encoder
+except ImportError:
+    orjson = None
 
 DRUGS = [
     ("amoxicillin", 500, "mg"),
@@ -21,6 +27,9 @@ DRUGS = [
     ("lisinopril", 10, "mg"),
 ]
 
+# Column views of DRUGS, indexed by a single sampled drug index
+_DRUG_NAMES, _DRUG_QTYS, _DRUG_UNITS = (tuple(col) for col in zip(*DRUGS))
+
 TRIAGE = [
     ("Call 911 immediately if chest pain worsens", "Rele 911 touswit si doulè kè a vin pi mal"),
     ("Go to the emergency room now if you cannot breathe well", "Ale nan ijans kounye a si ou pa ka respire byen"),
@@ -31,76 +40,90 @@ PROCEDURES = [
     ("Do not drive for 24 hours after anesthesia", "Pa kondwi pou 24 èdtan apre anestezi"),
 ]
 
+FIELDNAMES = (
+    'id', 'src_en', 'tgt_ht_literal', 'tgt_ht_localized', 'contains_dosage', 'dosage_json',
+    'instruction_type', 'risk_level', 'safety_flags', 'require_human_review', 'provenance', 'notes',
+)
+
+
+def _dumps(obj) -> str:
+    """Serialize to compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
 
 def dosage_json(drug, qty, unit, freq_hrs=None, freq_txt=None, max_daily=None, duration=None):
-    d={"drug":drug,"dose_qty":qty,"dose_unit":unit}
-    if freq_hrs: d["frequency_hours"]=freq_hrs
-    if freq_txt: d["frequency_text"]=freq_txt
-    if max_daily: d["max_daily_dose"]=max_daily
-    if duration: d["duration_days"]=duration
-    return json.dumps(d)
+    optional={"frequency_hours":freq_hrs,"frequency_text":freq_txt,"max_daily_dose":max_daily,"duration_days":duration}
+    d={"drug":drug,"dose_qty":qty,"dose_unit":unit,**{k:v for k,v in optional.items() if v}}
+    return _dumps(d)
+
+
+# Safety flags are constant per instruction kind, so encode them once
+_SAFETY_BULK_DOSAGE = _dumps(['requires_exact_dosage','human_review_required'])
+_SAFETY_TRIAGE_EMERG = _dumps(['emergency_instruction'])
+_SAFETY_PROC = _dumps(['safety_precaution'])
+
+FREQUENCIES = [6,8,12,24]
+
+# Every bulk dosage row has the same JSON shape, so fill a fixed template
+# instead of encoding a dict per row; checked against dosage_json() at import.
+_DOSAGE_TEMPLATE = '{"drug":"%s","dose_qty":%d,"dose_unit":"%s","frequency_hours":%d,"frequency_text":"every %d hours"}'
+
+
+def _check_dosage_template():
+    for drug, qty, unit in DRUGS:
+        for freq in FREQUENCIES:
+            if _DOSAGE_TEMPLATE % (drug, qty, unit, freq, freq) != dosage_json(
+                    drug, qty, unit, freq_hrs=freq, freq_txt=f'every {freq} hours'):
+                raise ValueError(f"dosage template does not match dosage_json() for {drug!r}")
+
+
+_check_dosage_template()
 
 
 def synthesize(count:int):
+    """Return high-risk rows as tuples in FIELDNAMES order."""
+    # Draw every random column up front in one choices() call each
+    kinds = choices(["dosage","triage","procedure"], k=count)
+    drug_idxs = choices(range(len(_DRUG_NAMES)), k=count)
+    freqs = choices(FREQUENCIES, k=count)
+    risks = choices(['high','medium'], k=count)
+    triages = choices(TRIAGE, k=count)
+    procedures = choices(PROCEDURES, k=count)
+    dosage_template = _DOSAGE_TEMPLATE
     rows=[]
-    i=0
-    while len(rows)<count:
-        kind = choice(["dosage","triage","procedure"]) if len(rows)<count else "dosage"
+    for n in range(count):
+        id_str = f'hr_bulk_{n+1:04d}'
+        kind = kinds[n]
         if kind=="dosage":
-            drug, base_qty, unit = choice(DRUGS)
-            qty = base_qty
-            freq = choice([6,8,12,24])
+            idx = drug_idxs[n]
+            drug = _DRUG_NAMES[idx]
+            qty = _DRUG_QTYS[idx]
+            unit = _DRUG_UNITS[idx]
+            freq = freqs[n]
             en = f"Take {drug} {qty}{unit} every {freq} hours"
             ht_lit = f"Pran {drug} {qty}{unit} chak {freq} èdtan"
             ht_loc = ht_lit
-            rows.append({
-                'id': f'hr_bulk_{len(rows)+1:04d}',
-                'src_en': en,
-                'tgt_ht_literal': ht_lit,
-                'tgt_ht_localized': ht_loc,
-                'contains_dosage': 1,
-                'dosage_json': dosage_json(drug, qty, unit, freq_hrs=freq, freq_txt=f'every {freq} hours'),
-                'instruction_type': 'dosage',
-                'risk_level': choice(['high','medium']),
-                'safety_flags': json.dumps(['requires_exact_dosage','human_review_required']),
-                'require_human_review': 1,
-                'provenance': 'bulk_generator',
-                'notes': f'Dosage instruction for {drug}'
-            })
+            rows.append((
+                id_str, en, ht_lit, ht_loc, 1,
+                dosage_template % (drug, qty, unit, freq, freq),
+                'dosage', risks[n], _SAFETY_BULK_DOSAGE, 1,
+                'bulk_generator', f'Dosage instruction for {drug}',
+            ))
         elif kind=="triage":
-            en, ht = choice(TRIAGE)
-            rows.append({
-                'id': f'hr_bulk_{len(rows)+1:04d}',
-                'src_en': en,
-                'tgt_ht_literal': ht,
-                'tgt_ht_localized': ht,
-                'contains_dosage': 0,
-                'dosage_json': '',
-                'instruction_type': 'triage',
-                'risk_level': 'high',
-                'safety_flags': json.dumps(['emergency_instruction']),
-                'require_human_review': 1,
-                'provenance': 'bulk_generator',
-                'notes': 'Emergency triage instruction'
-            })
+            en, ht = triages[n]
+            rows.append((
+                id_str, en, ht, ht, 0, '', 'triage', 'high', _SAFETY_TRIAGE_EMERG, 1,
+                'bulk_generator', 'Emergency triage instruction',
+            ))
         else:
-            en, ht = choice(PROCEDURES)
-            rows.append({
-                'id': f'hr_bulk_{len(rows)+1:04d}',
-                'src_en': en,
-                'tgt_ht_literal': ht,
-                'tgt_ht_localized': ht,
-                'contains_dosage': 0,
-                'dosage_json': '',
-                'instruction_type': 'procedure',
-                'risk_level': choice(['medium','high']),
-                'safety_flags': json.dumps(['safety_precaution']),
-                'require_human_review': 1,
-                'provenance': 'bulk_generator',
-                'notes': 'Procedure safety guidance'
-            })
-        i+=1
-    return rows[:count]
+            en, ht = procedures[n]
+            rows.append((
+                id_str, en, ht, ht, 0, '', 'procedure', risks[n], _SAFETY_PROC, 1,
+                'bulk_generator', 'Procedure safety guidance',
+            ))
+    return rows
 
 
 def main():
@@ -111,10 +134,13 @@ def main():
 
     rows=synthesize(args.count)
     args.output.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize the whole document in memory, then hand it to the file in one write
+    buf=io.StringIO()
+    w=csv.writer(buf)
+    w.writerow(FIELDNAMES)
+    w.writerows(rows)
     with args.output.open('w', encoding="utf-8-sig", newline='') as f:
-        w=csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        w.writeheader()
-        w.writerows(rows)
+        f.write(buf.getvalue())
     print(f"✅ Wrote {len(rows)} high-risk rows to {args.output}")
 
 if __name__=='__main__':
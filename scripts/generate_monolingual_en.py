@@ -15,103 +15,40 @@ Notes:
 """
 import argparse
 import csv
+import gzip
 from pathlib import Path
 from random import choice, randint
 
+from _haitian_patterns import load_patterns
 
-# Haitian Creole grammatical patterns for model training
-GRAMMAR_PATTERNS = [
-    # Tense/Aspect markers
-    ("tense", "M te manje diri a", "I ate the rice", "Past tense marker 'te'", "HC uses pre-verbal tense markers", "very_common", "basic"),
-    ("tense", "M ap manje diri a", "I am eating the rice", "Progressive marker 'ap'", "Continuous aspect in HC", "very_common", "basic"),
-    ("tense", "M pral manje diri a", "I will eat the rice", "Future marker 'pral'", "HC future formation", "very_common", "basic"),
-    ("aspect", "M fèk manje", "I just ate", "Recent past 'fèk'", "Immediate past aspect", "common", "intermediate"),
-    ("aspect", "M toujou ap manje", "I'm still eating", "Continuative 'toujou ap'", "Ongoing action emphasis", "common", "intermediate"),
-    
-    # Serial verb constructions
-    ("serial_verbs", "M pran liv la bay ou", "I take the book give you", "Serial verb: take-give", "HC allows verb serialization", "very_common", "intermediate"),
-    ("serial_verbs", "Li kouri al lakay", "He run go home", "Serial verb: run-go", "Motion + direction in HC", "common", "intermediate"),
-    ("serial_verbs", "Nou chita ap tann", "We sit waiting", "Posture + action serialization", "HC posture verbs in series", "common", "advanced"),
-    
-    # Question formation
-    ("question_formation", "Ki moun ki vin an?", "Who came?", "'Ki moun ki' question pattern", "HC wh-question with 'ki' doubling", "very_common", "basic"),
-    ("question_formation", "Ou fè sa pou ki sa?", "Why did you do that?", "Purpose question 'pou ki sa'", "HC reason/purpose questioning", "common", "basic"),
-    ("question_formation", "Èske w konnen kote li ye?", "Do you know where he is?", "Yes/no question with 'Èske'", "HC polar question formation", "very_common", "basic"),
-    
-    # Negation patterns
-    ("negation", "M pa konnen", "I don't know", "Simple negation with 'pa'", "HC basic negation", "very_common", "basic"),
-    ("negation", "M pa janm wè l", "I never saw him", "Never = 'pa janm'", "HC negative polarity item", "common", "basic"),
-    ("negation", "Li pa gen anyen", "He doesn't have anything", "Nothing = 'pa gen anyen'", "HC negative indefinite", "common", "intermediate"),
-]
-
-CREOLE_FEATURES = [
-    # Unique creole grammatical features
-    ("creole_features", "Se mwen ki pi gran", "It's me who is oldest", "Cleft construction 'se...ki'", "HC focus/emphasis structure", "very_common", "intermediate"),
-    ("creole_features", "Kote ou soti a?", "Where are you coming from?", "Motion verb + directional", "HC directional system", "very_common", "basic"),
-    ("creole_features", "M rete lakay mwen", "I stay at my house", "'rete' as copula/location", "HC location/residence verb", "very_common", "basic"),
-    ("creole_features", "Diri a bon anpil", "The rice is very good", "Post-nominal determiner 'a'", "HC definite article placement", "very_common", "basic"),
-    ("creole_features", "Timoun yo ap jwe", "The children are playing", "Plural marker 'yo' post-nominal", "HC plural formation", "very_common", "basic"),
-]
-
-SYNTAX_PATTERNS = [
-    # HC syntactic structures
-    ("syntax", "Granmoun yo ki nan kay la", "The adults who are in the house", "Relative clause with 'ki'", "HC relative clause formation", "common", "intermediate"),
-    ("syntax", "M wè yon moun k ap vini", "I see someone coming", "Reduced relative 'k ap'", "HC progressive relative", "common", "intermediate"),
-    ("syntax", "Depi m te piti", "Since I was small", "'Depi' temporal conjunction", "HC temporal subordination", "common", "intermediate"),
-    ("syntax", "Li pi wo pase m", "He's taller than me", "Comparative with 'pase'", "HC comparative construction", "common", "basic"),
-    ("syntax", "Nou tout ale", "We all went", "Quantifier 'tout' placement", "HC universal quantification", "common", "basic"),
-]
 
 # Vocabulary sets for substitution
-SUBJECTS = ["I", "You", "He", "She", "We", "They", "The family", "The child", "The woman", "The man"]
-TENSES = ["", "will", "should", "can", "might", "must"]
-PAST_TENSES = ["went", "came", "worked", "played", "ate", "drank", "studied", "spoke", "waited", "looked"]
-VERBS = ["go", "come", "work", "play", "eat", "drink", "study", "speak", "wait", "look", "listen", "read"]
-LOCATIONS = ["home", "the hospital", "school", "the market", "the house", "town", "the yard"]
-SYMPTOMS = ["pain", "illness", "fever", "headache", "stomach ache", "sore throat"]
-MEDICATIONS = ["aspirin", "paracetamol", "syrup", "herbal medicine", "tablets"]
-BODY_PARTS = ["head", "stomach", "heart", "foot", "hand", "back", "throat", "chest"]
-OBJECTS = ["food", "money", "clothes", "cash", "books", "work", "things"]
-WEATHER = ["sun", "rain", "wind", "clouds"]
-ACTIVITIES = ["Playing", "Working", "Eating", "Studying", "Dancing", "Singing"]
-ADJECTIVES = ["beautiful", "ugly", "big", "small", "good", "bad", "easy", "difficult", "hot", "cold"]
-
-# Compile template sets
-TEMPLATE_SETS = [
-    ("medical", TEMPLATES_MEDICAL),
-    ("general", TEMPLATES_GENERAL),
-    ("education", TEMPLATES_EDUCATION),
-]
-
-
-def generate_pattern_variants():
-    """Generate additional pattern examples through systematic variation"""
-    # Medical domain HC patterns
-    medical_patterns = [
-        ("grammar", "Pasyan an gen doulè", "The patient has pain", "HC definite article 'an'", "Medical context with HC grammar", "common", "basic", "medical"),
-        ("tense", "M te pran renmèd la", "I took the medicine", "Past tense in medical context", "HC past marker with medication", "very_common", "basic", "medical"),
-        ("question_formation", "Ki jan ou santi w?", "How do you feel?", "Health inquiry pattern", "Common medical question in HC", "very_common", "basic", "medical"),
-        ("negation", "M pa gen lafyèv", "I don't have fever", "Medical negation", "HC negative in symptom reporting", "very_common", "basic", "medical"),
-    ]
-    
-    # General conversation HC patterns
-    general_patterns = [
-        ("grammar", "Kote ou ye?", "Where are you?", "Location question", "HC location inquiry", "very_common", "basic", "general"),
-        ("tense", "M ap ale lakay", "I'm going home", "Progressive motion", "HC directional with progressive", "very_common", "basic", "general"),
-        ("aspect", "M fèk rive", "I just arrived", "Recent completion", "HC immediate past", "common", "intermediate", "general"),
-    ]
-    
-    return medical_patterns + general_patterns
-
-
-def generate_patterns(count: int):
-    patterns = []
-    all_patterns = GRAMMAR_PATTERNS + CREOLE_FEATURES + SYNTAX_PATTERNS + generate_pattern_variants()
+SUBJECTS = ("I", "You", "He", "She", "We", "They", "The family", "The child", "The woman", "The man")
+TENSES = ("", "will", "should", "can", "might", "must")
+PAST_TENSES = ("went", "came", "worked", "played", "ate", "drank", "studied", "spoke", "waited", "looked")
+VERBS = ("go", "come", "work", "play", "eat", "drink", "study", "speak", "wait", "look", "listen", "read")
+LOCATIONS = ("home", "the hospital", "school", "the market", "the house", "town", "the yard")
+SYMPTOMS = ("pain", "illness", "fever", "headache", "stomach ache", "sore throat")
+MEDICATIONS = ("aspirin", "paracetamol", "syrup", "herbal medicine", "tablets")
+BODY_PARTS = ("head", "stomach", "heart", "foot", "hand", "back", "throat", "chest")
+OBJECTS = ("food", "money", "clothes", "cash", "books", "work", "things")
+WEATHER = ("sun", "rain", "wind", "clouds")
+ACTIVITIES = ("Playing", "Working", "Eating", "Studying", "Dancing", "Singing")
+ADJECTIVES = ("beautiful", "ugly", "big", "small", "good", "bad", "easy", "difficult", "hot", "cold")
+
+FIELDNAMES = ("id", "pattern_type", "haitian_example", "english_gloss",
+              "grammatical_description", "linguistic_notes", "frequency",
+              "difficulty", "domain")
+
+
+def iter_patterns(count: int):
+    """Yield pattern rows as tuples in FIELDNAMES order."""
+    all_patterns = tuple(pattern for _, pattern in load_patterns())
     
     for i in range(count):
         if i < len(all_patterns):
             # Use curated patterns first
-            if len(all_patterns[i]) == 7:  # Has domain
+            if len(all_patterns[i]) == 8:  # Has domain
                 pattern_type, ht_example, en_gloss, gram_desc, ling_notes, freq, diff, domain = all_patterns[i]
             else:
                 pattern_type, ht_example, en_gloss, gram_desc, ling_notes, freq, diff = all_patterns[i]
@@ -119,44 +56,36 @@ def generate_patterns(count: int):
         else:
             # Generate variations of existing patterns
             base = choice(all_patterns)
-            if len(base) == 7:
+            if len(base) == 8:
                 pattern_type, ht_example, en_gloss, gram_desc, ling_notes, freq, diff, domain = base
             else:
                 pattern_type, ht_example, en_gloss, gram_desc, ling_notes, freq, diff = base
                 domain = choice(["medical", "general", "education"])
         
-        patterns.append({
-            "id": i + 1,
-            "pattern_type": pattern_type,
-            "haitian_example": ht_example,
-            "english_gloss": en_gloss,
-            "grammatical_description": gram_desc,
-            "linguistic_notes": ling_notes,
-            "frequency": freq,
-            "difficulty": diff,
-            "domain": domain,
-        })
-    return patterns
+        yield (i + 1, pattern_type, ht_example, en_gloss, gram_desc,
+               ling_notes, freq, diff, domain)
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--count", type=int, default=12000)
     ap.add_argument("--output", type=Path, default=Path("data/seed/09_haitian_patterns.csv"))
+    ap.add_argument("--compress", action="store_true", help="gzip the CSV output")
     args = ap.parse_args()
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    patterns = generate_patterns(args.count)
-
-    with args.output.open("w", newline='', encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["id", "pattern_type", "haitian_example", "english_gloss", 
-                       "grammatical_description", "linguistic_not    print(f"✅ Generated {len(patterns)} Haitian Creole patterns to {args.output}")
-       writer.writeheader()
-        writer.writerows(patterns)
-
-    print(f"✅ Generated {len(patterns)} Haitian Creole patterns to {args.output}")
+    output = args.output
+    if args.compress:
+        output = output.with_name(output.name + ".gz")
+        stream = gzip.open(output, "wt", compresslevel=1, encoding="utf-8", newline="")
+    else:
+        stream = output.open("w", newline="", encoding="utf-8", buffering=1 << 20)
+    with stream as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(iter_patterns(args.count))
+
+    print(f"✅ Generated {args.count} Haitian Creole patterns to {output}")
 
 
 if __name__ == "__main__":
@@ -12,13 +12,39 @@ Notes:
 - Covers medical, general, education, etc. domains
 """
 import argparse
-import csv
+import gzip
+import hashlib
+import io
+import os
+import random
+import re
+import shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from random import choice, randint
+from string import Formatter
+from typing import Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-# Template-driven generation
-TEMPLATES_MEDICAL = [
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
+
+def _tokenize(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split template into (literal, placeholder) segments; the last placeholder may be None."""
+    return tuple((literal, name) for literal, name, _, _ in Formatter().parse(template))
+
+
+# Template-driven generation, tokenized once at import
+TEMPLATES_MEDICAL = tuple(_tokenize(t) for t in (
     "{subject} gen {symptom} {location}.",
     "{subject} {tense} pran {medication} {dosage}.",
     "Doktè a {tense} mande {subject} {action}.",
@@ -27,9 +53,9 @@ TEMPLATES_MEDICAL = [
     "{subject} gen doulè nan {body_part} li.",
     "Renmèd la {tense} {effect} {subject}.",
     "{subject} dwe {action} anvan yo {test}.",
-]
+))
 
-TEMPLATES_GENERAL = [
+TEMPLATES_GENERAL = tuple(_tokenize(t) for t in (
     "{subject} {tense} {verb} nan {location}.",
     "{subject} ap {verb} {object} yo.",
     "{weather} {tense} {intensity} jòdi a.",
@@ -39,9 +65,9 @@ TEMPLATES_GENERAL = [
     "{activity} sa a {tense} {adjective}.",
     "{subject} ap {verb} pou {goal}.",
     "{time}, {subject} {tense} {verb}.",
-]
+))
 
-TEMPLATES_EDUCATION = [
+TEMPLATES_EDUCATION = tuple(_tokenize(t) for t in (
     "Elèv yo {tense} {verb} {subject_area}.",
     "Pwofesè a {tense} eksplike {topic}.",
     "{subject} ap {verb} nan {institution}.",
@@ -49,119 +75,294 @@ TEMPLATES_EDUCATION = [
     "Yo bezwen {verb} {material} yo.",
     "Klas la {tense} kòmanse a {time}.",
     "{subject} {tense} {performance} nan {test}.",
-]
+))
 
 # Vocabulary sets for substitution
-SUBJECTS = ["Mwen", "Ou", "Li", "Nou", "Yo", "Fanmi an", "Timoun nan", "Madanm nan", "Mesye a", "Granmoun yo"]
-TENSES = ["", "te", "ap", "pral", "ka", "ta"]
-VERBS = ["ale", "vini", "travay", "jwe", "manje", "bwè", "etidye", "pale", "tann", "gade", "koute", "li"]
-LOCATIONS = ["lakay", "lopital la", "lekòl la", "mache a", "kay la", "vil la", "lakou a"]
-SYMPTOMS = ["doulè", "maladi", "tenp", "tèt k ap fè mal", "vant k ap fè mal", "gòj ki gen doulè"]
-MEDICATIONS = ["aspirinn", "paracetamol", "siwo", "kréyòl", "renmèd fèy"]
-BODY_PARTS = ["tèt", "vant", "kè", "pye", "men", "do", "gòj", "pwatrin"]
-OBJECTS = ["manje", "lajan", "rad", "kòb", "liv", "travay", "bagay"]
-WEATHER = ["Solèy la", "Lapli a", "Van an", "Nwaj yo"]
-ACTIVITIES = ["Jwe", "Travay", "Manje", "Etidye", "Danse", "Chante"]
-ADJECTIVES = ["bèl", "lèd", "gwo", "ti", "bon", "move", "fasil", "difisil", "cho", "frè"]
+SUBJECTS = ("Mwen", "Ou", "Li", "Nou", "Yo", "Fanmi an", "Timoun nan", "Madanm nan", "Mesye a", "Granmoun yo")
+TENSES = ("", "te", "ap", "pral", "ka", "ta")
+VERBS = ("ale", "vini", "travay", "jwe", "manje", "bwè", "etidye", "pale", "tann", "gade", "koute", "li")
+LOCATIONS = ("lakay", "lopital la", "lekòl la", "mache a", "kay la", "vil la", "lakou a")
+SYMPTOMS = ("doulè", "maladi", "tenp", "tèt k ap fè mal", "vant k ap fè mal", "gòj ki gen doulè")
+MEDICATIONS = ("aspirinn", "paracetamol", "siwo", "kréyòl", "renmèd fèy")
+BODY_PARTS = ("tèt", "vant", "kè", "pye", "men", "do", "gòj", "pwatrin")
+OBJECTS = ("manje", "lajan", "rad", "kòb", "liv", "travay", "bagay")
+WEATHER = ("Solèy la", "Lapli a", "Van an", "Nwaj yo")
+ACTIVITIES = ("Jwe", "Travay", "Manje", "Etidye", "Danse", "Chante")
+ADJECTIVES = ("bèl", "lèd", "gwo", "ti", "bon", "move", "fasil", "difisil", "cho", "frè")
 
 # Compile template sets
-TEMPLATE_SETS = [
+TEMPLATE_SETS = (
     ("medical", TEMPLATES_MEDICAL),
     ("general", TEMPLATES_GENERAL),
     ("education", TEMPLATES_EDUCATION),
-]
-
-
-def substitute_template(template: str, domain: str):
-    """Fill template with vocabulary appropriate to domain"""
-    replacements = {
-        "{subject}": choice(SUBJECTS),
-        "{tense}": choice(TENSES),
-        "{verb}": choice(VERBS),
-        "{location}": choice(LOCATIONS),
-        "{object}": choice(OBJECTS),
-        "{adjective}": choice(ADJECTIVES),
-        "{weather}": choice(WEATHER),
-        "{activity}": choice(ACTIVITIES),
-        "{intensity}": choice(["anpil", "yon ti kras", "twò", "pi bon"]),
-        "{time}": choice(["nan maten", "nan aswè", "jòdi a", "yè", "demen"]),
-        "{goal}": choice(["fè bagay yo", "ede moun yo", "gen lajan", "aprann"]),
-        "{person}": choice(["zanmi li", "fanmi li", "vwazen an", "doktè a"]),
-        "{purpose}": choice(["pou travay", "pou jwe", "pou manje", "pou etidye"]),
-        "{frequency}": choice(["jou", "semèn", "mwa", "ane"]),
-    }
-    # Medical-specific
-    if domain == "medical":
-        replacements.update({
-            "{symptom}": choice(SYMPTOMS),
-            "{medication}": choice(MEDICATIONS),
-            "{dosage}": f"{randint(1,4)} {choice(['tablèt', 'kiyè', 'kapsul'])}",
-            "{body_part}": choice(BODY_PARTS),
-            "{condition}": choice(["Maladi", "Doulè", "Pwoblèm", "Ensifizans"]),
-            "{consequence}": choice(["danje", "pi mal", "pi bon", "koze pwoblèm"]),
-            "{action}": choice(["pran renmèd", "repoze", "bwè dlo", "ale lopital"]),
-            "{effect}": choice(["ede", "geri", "soulaje", "amelyore"]),
-            "{test}": choice(["teste", "egzaminen", "operasyon"]),
-        })
-    # Education-specific
-    elif domain == "education":
-        replacements.update({
-            "{subject_area}": choice(["matematik", "istwa", "syans", "kreyòl", "angle"]),
-            "{topic}": choice(["fowmil yo", "evenman yo", "ekspèriman an"]),
-            "{institution}": choice(["lekòl la", "inivèsite a", "bibliyotèk la"]),
-            "{difficulty}": choice(["difisil", "fasil", "entèresan", "ennuyan"]),
-            "{material}": choice(["liv", "karakil", "òdinatè", "tablo"]),
-            "{performance}": choice(["reisi", "echwe", "byen fè", "pi mal"]),
-            "{test}": choice(["egzamen", "devwa", "pwojè"]),
-        })
-
-    result = template
-    for placeholder, replacement in replacements.items():
-        result = result.replace(placeholder, replacement)
-    return result.strip()
-
-
-def generate_sentences(count: int):
-    sentences = []
-    for i in range(count):
-        domain, templates = choice(TEMPLATE_SETS)
-        template = choice(templates)
-        text = substitute_template(template, domain)
-        complexity = choice(["simple", "medium", "complex"])
-        topic = {
-            "medical": choice(["symptoms", "treatment", "doctor_visit", "medication"]),
-            "general": choice(["daily_life", "family", "weather", "activities"]),
-            "education": choice(["school", "learning", "exams", "teaching"]),
-        }[domain]
-        
-        sentences.append({
-            "id": i + 1,
-            "text": text,
-            "domain": domain,
-            "topic": topic,
-            "complexity": complexity,
-        })
-    return sentences
+)
+DOMAINS = tuple(domain for domain, _ in TEMPLATE_SETS)
+
+FIELDNAMES = ("id", "text", "domain", "topic", "complexity")
+PARALLEL_MIN_COUNT = 10_000
+CHUNK_ROWS = 10_000  # rows per parallel chunk; chunk i is seeded with seed + i
+CACHE_DIR = Path("data/.cache")
+ARROW_BATCH_ROWS = 65_536
+BOM = b"\xef\xbb\xbf"
+DEDUP_RETRIES = 4
+
+# Substitution pools per domain, built once at import; only placeholders
+# present in a template are sampled
+POOLS_GENERAL = {
+    "subject": SUBJECTS,
+    "tense": TENSES,
+    "verb": VERBS,
+    "location": LOCATIONS,
+    "object": OBJECTS,
+    "adjective": ADJECTIVES,
+    "weather": WEATHER,
+    "activity": ACTIVITIES,
+    "intensity": ("anpil", "yon ti kras", "twò", "pi bon"),
+    "time": ("nan maten", "nan aswè", "jòdi a", "yè", "demen"),
+    "goal": ("fè bagay yo", "ede moun yo", "gen lajan", "aprann"),
+    "person": ("zanmi li", "fanmi li", "vwazen an", "doktè a"),
+    "purpose": ("pou travay", "pou jwe", "pou manje", "pou etidye"),
+    "frequency": ("jou", "semèn", "mwa", "ane"),
+}
+POOLS_MEDICAL = {
+    **POOLS_GENERAL,
+    "symptom": SYMPTOMS,
+    "medication": MEDICATIONS,
+    # every "<1-4> <unit>" combination, equally likely
+    "dosage": tuple(f"{n} {unit}" for n in range(1, 5) for unit in ("tablèt", "kiyè", "kapsul")),
+    "body_part": BODY_PARTS,
+    "condition": ("Maladi", "Doulè", "Pwoblèm", "Ensifizans"),
+    "consequence": ("danje", "pi mal", "pi bon", "koze pwoblèm"),
+    "action": ("pran renmèd", "repoze", "bwè dlo", "ale lopital"),
+    "effect": ("ede", "geri", "soulaje", "amelyore"),
+    "test": ("teste", "egzaminen", "operasyon"),
+}
+POOLS_EDUCATION = {
+    **POOLS_GENERAL,
+    "subject_area": ("matematik", "istwa", "syans", "kreyòl", "angle"),
+    "topic": ("fowmil yo", "evenman yo", "ekspèriman an"),
+    "institution": ("lekòl la", "inivèsite a", "bibliyotèk la"),
+    "difficulty": ("difisil", "fasil", "entèresan", "ennuyan"),
+    "material": ("liv", "karakil", "òdinatè", "tablo"),
+    "performance": ("reisi", "echwe", "byen fè", "pi mal"),
+    "test": ("egzamen", "devwa", "pwojè"),
+}
+DOMAIN_POOLS = {
+    "general": POOLS_GENERAL,
+    "medical": POOLS_MEDICAL,
+    "education": POOLS_EDUCATION,
+}
+TOPICS = {
+    "medical": ("symptoms", "treatment", "doctor_visit", "medication"),
+    "general": ("daily_life", "family", "weather", "activities"),
+    "education": ("school", "learning", "exams", "teaching"),
+}
+COMPLEXITIES = ("simple", "medium", "complex")
+
+
+def _compile_emitter(template):
+    """Generate emit(n, *columns) -> n finished texts for one template.
+
+    The template's literals are inlined into a single f-string inside a
+    list comprehension, so a row costs one f-string build and a strip()
+    with no format-string parsing or per-slot lookups.
+    """
+    names = [name for _, name in template if name]
+    slots = [f"v{k}" for k in range(len(names))]
+    body, k = [], 0
+    for literal, name in template:
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name:
+            body.append("{" + slots[k] + "}")
+            k += 1
+    text = "f" + repr("".join(body))
+    if slots:
+        columns = [f"c{k}" for k in range(len(slots))]
+        source = (f"def emit(n, {', '.join(columns)}):\n"
+                  f"    return [{text}.strip() for {', '.join(slots)}, in zip({', '.join(columns)})]\n")
+    else:
+        source = f"def emit(n):\n    return [{text}.strip()] * n\n"
+    namespace = {}
+    exec(source, namespace)
+    return tuple(names), namespace["emit"]
+
+
+# Specialized emitter per template, generated once at import
+EMITTERS = {template: _compile_emitter(template) for _, templates in TEMPLATE_SETS for template in templates}
+
+
+def make_sampler(seed: Optional[int] = None):
+    """Return draw(pool, k) -> list of k values from pool, drawn in one bulk call.
+
+    Uses NumPy's generator when available (one integers() call plus an
+    object-array gather per column), otherwise random.Random.choices.
+    """
+    if np is None:
+        py_rng = random.Random(seed)
+        return lambda pool, k: py_rng.choices(pool, k=k)
+
+    rng = np.random.default_rng(seed)
+    return lambda pool, k: np.array(pool, dtype=object)[rng.integers(0, len(pool), size=k)].tolist()
+
+
+def domain_sentences(domain: str, templates, n: int, draw, seen: set):
+    """Return n (text, topic) pairs for one domain, pre-drawing one column per template slot.
+
+    A text already in seen is redrawn from the same template, up to
+    DEDUP_RETRIES times, before being accepted as a duplicate.
+    """
+    pools = DOMAIN_POOLS[domain]
+    by_template = defaultdict(list)
+    for i, t in enumerate(draw(range(len(templates)), n)):
+        by_template[templates[t]].append(i)
+
+    texts = [None] * n
+    for template, rows in by_template.items():
+        names, emit = EMITTERS[template]
+        for attempt in range(DEDUP_RETRIES + 1):
+            columns = [draw(pools[name], len(rows)) for name in names]
+            retry = []
+            for i, text in zip(rows, emit(len(rows), *columns)):
+                if text in seen and attempt < DEDUP_RETRIES:
+                    retry.append(i)
+                    continue
+                seen.add(text)
+                texts[i] = text
+            if not retry:
+                break
+            rows = retry
+    return zip(texts, draw(TOPICS[domain], n))
+
+
+def iter_sentences(count: int, seed: Optional[int] = None, start: int = 0):
+    """Yield sentence rows (ids start + 1 onwards) as tuples in FIELDNAMES order.
+
+    Domain sizes are drawn up front (a multinomial split of count) and each
+    domain is emitted as one contiguous block, so rows are grouped by domain.
+    Texts are deduplicated within one call (i.e. per parallel chunk).
+    """
+    draw = make_sampler(seed)
+    counts = Counter(draw(DOMAINS, count))
+    complexities = iter(draw(COMPLEXITIES, count))
+
+    seen = set()
+    row_id = start
+    for domain, templates in TEMPLATE_SETS:
+        for text, topic in domain_sentences(domain, templates, counts[domain], draw, seen):
+            row_id += 1
+            yield (row_id, text, domain, topic, next(complexities))
+
+
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def _q(value: str) -> str:
+    """CSV-quote a cell the way csv.writer does."""
+    if _NEEDS_QUOTING.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def format_rows(rows):
+    """Yield CSV lines for sentence rows; only the free-text column can need quoting."""
+    for row_id, text, domain, topic, complexity in rows:
+        yield f"{row_id},{_q(text)},{domain},{topic},{complexity}\r\n"
+
+
+def write_arrow(rows, out):
+    """Stream rows through Arrow's C++ CSV writer, one record batch per ARROW_BATCH_ROWS rows.
+
+    Arrow quotes every string cell; the file parses to the same values as
+    the format_rows output.
+    """
+    schema = pa.schema([(name, pa.int64() if name == "id" else pa.string()) for name in FIELDNAMES])
+    options = pa_csv.WriteOptions(include_header=False, eol="\r\n")
+    rows = iter(rows)
+    with pa_csv.CSVWriter(out, schema, write_options=options) as writer:
+        while batch := list(islice(rows, ARROW_BATCH_ROWS)):
+            writer.write_batch(pa.record_batch([pa.array(col) for col in zip(*batch)], schema=schema))
+
+
+def render_rows(rows) -> bytes:
+    """Serialize rows (no header) to UTF-8 CSV bytes with whichever writer is available."""
+    if pa is None:
+        return "".join(format_rows(rows)).encode("utf-8")
+    buf = io.BytesIO()
+    write_arrow(rows, buf)
+    return buf.getvalue()
+
+
+def sentence_chunk(job) -> bytes:
+    """Pool worker: rows start..end drawn from their own seed, returned as rendered CSV bytes."""
+    seed, start, end = job
+    return render_rows(iter_sentences(end - start, seed, start))
+
+
+def parallel_chunks(count: int, seed: int, workers: int = 0):
+    """Yield rendered CSV chunks of CHUNK_ROWS rows in id order; chunk i uses seed + i.
+
+    The chunk layout depends only on count, so seeded output is the same
+    for any number of workers. Workers hand back bytes rather than row
+    lists, so nothing but the finished CSV crosses the process boundary.
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(seed + i, lo, min(lo + CHUNK_ROWS, count)) for i, lo in enumerate(range(0, count, CHUNK_ROWS))]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs) or 1)) as executor:
+        yield from executor.map(sentence_chunk, jobs)
+
+
+def cache_path(count: int, seed: int) -> Path:
+    """Cache file for a seeded run, keyed on this script's source and the run parameters."""
+    key = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    key.update(repr((count, seed, np is not None, pa is not None)).encode())
+    return CACHE_DIR / f"08_monolingual_ht-{key.hexdigest()}.csv.gz"
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--count", type=int, default=12000)
     ap.add_argument("--output", type=Path, default=Path("data/seed/08_monolingual_ht.csv"))
+    ap.add_argument("--seed", type=int, default=None, help="fix the RNG seed for reproducible output")
+    ap.add_argument("--no-cache", action="store_true", help="regenerate even if a cached seeded run exists")
+    ap.add_argument("--compress", action="store_true", help="gzip the CSV output")
     args = ap.parse_args()
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    sentences = generate_sentences(args.count)
+    output = args.output.with_name(args.output.name + ".gz") if args.compress else args.output
+
+    # Seeded runs are deterministic, so a repeat run just unpacks the cached CSV
+    cache = None if args.seed is None or args.no_cache else cache_path(args.count, args.seed)
+    if cache is not None and cache.exists():
+        if args.compress:
+            shutil.copyfile(cache, output)
+        else:
+            with gzip.open(cache, "rb") as src, output.open("wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        print(f"✅ Reused cached {args.count} Haitian Creole sentences for {output}")
+        return
+
+    if args.count > PARALLEL_MIN_COUNT:
+        chunks = parallel_chunks(args.count, random.Random(args.seed).randrange(2**32))
+    else:
+        chunks = (render_rows(iter_sentences(args.count, args.seed)),)
+
+    stream = gzip.open(output, "wb", compresslevel=1) if args.compress else output.open("wb", buffering=1 << 20)
+    with stream as f:
+        f.write(BOM + (",".join(FIELDNAMES) + "\r\n").encode("utf-8"))
+        for chunk in chunks:
+            f.write(chunk)
 
-    with args.output.open("w", encoding="utf-8-sig", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["id", "text", "domain", "topic", "complexity"],
-        )
-        writer.writeheader()
-        writer.writerows(sentences)
+    if cache is not None:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(".tmp")
+        if args.compress:
+            shutil.copyfile(output, tmp)
+        else:
+            with output.open("rb") as src, gzip.open(tmp, "wb", compresslevel=1) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp, cache)
 
-    print(f"✅ Generated {len(sentences)} Haitian Creole sentences to {args.output}")
+    print(f"✅ Generated {args.count} Haitian Creole sentences to {output}")
 
 
 if __name__ == "__main__":
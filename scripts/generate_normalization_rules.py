@@ -8,6 +8,12 @@ Creates rules for contractions, slang, code-switched terms, and variants.
 import sqlite3
 from pathlib import Path
 
+NORMALIZATION_COLUMNS = (
+    'id', 'variant', 'canonical', 'english_equivalent', 'register',
+    'region', 'examples', 'code_switch_type', 'language_origin',
+    'mixed_context_notes',
+)
+
 
 def create_normalization_rules():
     """Create normalization rules for Creole slang and code-switching"""
@@ -181,8 +187,14 @@ def create_normalization_rules():
     return rules
 
 
-def insert_normalization_rules(db_path: str):
-    """Insert normalization rules into database"""
+def insert_normalization_rules(db_path: str, mirror_path: str = None):
+    """Insert normalization rules into database, optionally copying them to mirror_path
+
+    The mirror copy is a single INSERT ... SELECT through ATTACH DATABASE.
+    If that fails (e.g. the mirror lacks the table) the error is reported
+    once; a direct insert would fail the same way. If db_path itself fails,
+    the rules are still inserted into the mirror on their own.
+    """
 
     rules = create_normalization_rules()
 
@@ -192,29 +204,40 @@ def insert_normalization_rules(db_path: str):
 
     # Connect to database
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    rows = [tuple(rule[col] for col in NORMALIZATION_COLUMNS) for rule in rules]
 
     try:
-        # Insert rules
-        for rule in rules:
-            cursor.execute("""
-                INSERT OR REPLACE INTO normalization_rules (
-                    id, variant, canonical, english_equivalent, register,
-                    region, examples, code_switch_type, language_origin,
-                    mixed_context_notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                rule['id'], rule['variant'], rule['canonical'],
-                rule['english_equivalent'], rule['register'], rule['region'],
-                rule['examples'], rule['code_switch_type'],
-                rule['language_origin'], rule['mixed_context_notes']
-            ))
-
-        conn.commit()
-        print("2"✅ Added {len(rules)} normalization rules"
+        # Insert all rules in one transaction
+        with conn:
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO normalization_rules ({', '.join(NORMALIZATION_COLUMNS)})
+                VALUES ({', '.join('?' * len(NORMALIZATION_COLUMNS))})
+            """, rows)
+
+        print(f"✅ Added {len(rules)} normalization rules")
     except sqlite3.Error as e:
         print(f"❌ Failed to insert rules: {e}")
-        conn.rollback()
+        conn.close()
+        if mirror_path:
+            insert_normalization_rules(mirror_path)
+        return
+
+    try:
+        if mirror_path:
+            conn.execute("ATTACH DATABASE ? AS mirror_db", (mirror_path,))
+            columns = ', '.join(NORMALIZATION_COLUMNS)
+            with conn:
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO mirror_db.normalization_rules ({columns})
+                    SELECT {columns} FROM main.normalization_rules
+                    WHERE id IN ({', '.join('?' * len(rows))})
+                """, [row[0] for row in rows])
+            print(f"✅ Copied {len(rules)} normalization rules to {mirror_path}")
+    except sqlite3.Error as e:
+        print(f"❌ Failed to copy rules to {mirror_path}: {e}")
 
     finally:
         conn.close()
@@ -230,14 +253,14 @@ def main():
     print("📝 Generating Normalization Rules")
     print("=" * 40)
 
-    # Insert into seed database first (for development)
+    # Insert into seed database first (for development), then copy the
+    # same rows into the primary database if it exists
     print("💾 Inserting into seed database...")
-    insert_normalization_rules(str(seed_db))
-
-    # Also insert into primary database if it exists
     if primary_db.exists():
-        print("💾 Also inserting into primary corpus database...")
-        insert_normalization_rules(str(primary_db))
+        print("💾 Also copying into primary corpus database...")
+        insert_normalization_rules(str(seed_db), str(primary_db))
+    else:
+        insert_normalization_rules(str(seed_db))
 
     print("\n✅ Normalization rules added successfully!")
     print("\nKey additions:")
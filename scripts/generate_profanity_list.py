@@ -35,22 +35,23 @@ EN_PROFANITY_CORE = [
 CATEGORIES = ["profanity","insult","vulgarity","sexual","body","expletive"]
 SEVERITIES = ["mild","moderate","strong"]
 
+FIELDNAMES = (
+    "term_creole","term_english","severity","category",
+    "safe_alternatives_ht","safe_alternatives_en","cultural_note",
+    "should_flag","should_block",
+)
+
 
 def inflate_terms(target: int, include_sensitive: bool = False):
+    """Return up to target rows as tuples in FIELDNAMES order."""
     rows = []
     # Seed rows
     for ht, en, sev, cat, safer_ht, safer_en, note in BASE_TERMS:
-        rows.append({
-            "term_creole": ht,
-            "term_english": en,
-            "severity": sev,
-            "category": cat,
-            "safe_alternatives_ht": ", ".join(safer_ht),
-            "safe_alternatives_en": ", ".join(safer_en),
-            "cultural_note": note,
-            "should_flag": "1",
-            "should_block": "0" if sev != "strong" else "1",
-        })
+        rows.append((
+            ht, en, sev, cat,
+            ", ".join(safer_ht), ", ".join(safer_en), note,
+            "1", "0" if sev != "strong" else "1",
+        ))
 
     # Expand from core lists by pairing and varying metadata
     i = 0
@@ -67,33 +68,21 @@ def inflate_terms(target: int, include_sensitive: bool = False):
         cat = CATEGORIES[i % len(CATEGORIES)]
         safer_ht = ["fè atansyon", "tanpri"][: 1 + (i % 2)]
         safer_en = ["please", "mind your words"][ : 1 + (i % 2)]
-        rows.append({
-            "term_creole": term_ht,
-            "term_english": term_en,
-            "severity": sev,
-            "category": cat,
-            "safe_alternatives_ht": ", ".join(safer_ht),
-            "safe_alternatives_en": ", ".join(safer_en),
-            "cultural_note": "auto-generated; review for accuracy",
-            "should_flag": "1",
-            "should_block": "1" if sev == "strong" else "0",
-        })
+        rows.append((
+            term_ht, term_en, sev, cat,
+            ", ".join(safer_ht), ", ".join(safer_en), "auto-generated; review for accuracy",
+            "1", "1" if sev == "strong" else "0",
+        ))
 
     # Optionally include sensitive categories after manual curation only
     if include_sensitive:
         # Placeholder rows clearly marked for offline replacement
         while len(rows) < target:
-            rows.append({
-                "term_creole": "[CURATE_OFFLINE]",
-                "term_english": "[CURATE_OFFLINE]",
-                "severity": "strong",
-                "category": "sensitive",
-                "safe_alternatives_ht": "[CURATE_OFFLINE]",
-                "safe_alternatives_en": "[CURATE_OFFLINE]",
-                "cultural_note": "Add with care; policy review required",
-                "should_flag": "1",
-                "should_block": "1",
-            })
+            rows.append((
+                "[CURATE_OFFLINE]", "[CURATE_OFFLINE]", "strong", "sensitive",
+                "[CURATE_OFFLINE]", "[CURATE_OFFLINE]", "Add with care; policy review required",
+                "1", "1",
+            ))
 
     return rows[:target]
 
@@ -108,16 +97,9 @@ def main():
     args.output.parent.mkdir(parents=True, exist_ok=True)
     rows = inflate_terms(args.count, include_sensitive=args.include_sensitive)
 
-    with args.output.open("w", encoding="utf-8-sig", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "term_creole","term_english","severity","category",
-                "safe_alternatives_ht","safe_alternatives_en","cultural_note",
-                "should_flag","should_block",
-            ],
-        )
-        writer.writeheader()
+    with args.output.open("w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
         writer.writerows(rows)
 
     print(f"✅ Wrote {len(rows)} profanity entries to {args.output}")
@@ -15,19 +15,35 @@ Strategy:
 Usage:
     python scripts/generate_seed_corpus.py --count 500 --domain medical
     python scripts/generate_seed_corpus.py --count 300 --domain general
+
+Faster int8 CPU/GPU inference with CTranslate2 (one-time conversion):
+    ct2-transformers-converter --model facebook/nllb-200-distilled-600M \\
+        --output_dir ct2_nllb --quantization int8 --copy_files sentencepiece.bpe.model
+    python scripts/generate_seed_corpus.py --count 500 --backend ctranslate2
 """
 
 import sys
 import csv
 import argparse
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.translator import KalimaxTranslator
 
+# Phrases per translate_batch call
+BATCH_SIZE = 32
+
+# Rows buffered before each write + flush to the output CSV
+FLUSH_ROWS = 256
+
+FIELDNAMES = (
+    'src_text', 'src_lang', 'tgt_text_literal', 'tgt_text_localized', 'tgt_lang',
+    'domain', 'cultural_note', 'confidence', 'curation_status', 'audience'
+)
+
 
 # Medical phrases (common patient-facing)
 MEDICAL_PHRASES = [
@@ -164,7 +180,12 @@ PUBLIC_HEALTH_PHRASES = [
 def generate_corpus(
     domain: str = "medical",
     count: int = 200,
-    output_csv: str = "data/seed/generated_corpus.csv"
+    output_csv: str = "data/seed/generated_corpus.csv",
+    batch_size: int = BATCH_SIZE,
+    backend: str = "transformers",
+    ct2_model_path: str = "ct2_nllb",
+    device_index: Optional[List[int]] = None,
+    inter_threads: int = 1
 ) -> int:
     """
     Generate seed corpus using NLLB base model
@@ -173,6 +194,11 @@ def generate_corpus(
         domain: Domain to generate (medical, general, public_health)
         count: Number of phrases to translate
         output_csv: Output CSV file path
+        batch_size: Phrases per translate_batch call
+        backend: Translator backend ("transformers" or "ctranslate2")
+        ct2_model_path: Converted CTranslate2 model directory
+        device_index: GPU indices to spread CTranslate2 batches over
+        inter_threads: CTranslate2 workers per device
     """
     
     # Select phrase list
@@ -192,60 +218,78 @@ def generate_corpus(
     print(f"📥 Loading NLLB model (this may take a while)...\n")
     
     # Initialize translator
-    translator = KalimaxTranslator()
+    translator = KalimaxTranslator(
+        backend=backend,
+        ct2_model_path=ct2_model_path,
+        device_index=device_index or 0,
+        inter_threads=inter_threads
+    )
     
     # Prepare output
     output_path = Path(output_csv)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    results = []
-    
-    for i, phrase in enumerate(phrases, 1):
-        print(f"[{i}/{len(phrases)}] Translating: {phrase[:50]}...")
+    # Stream rows to disk in FLUSH_ROWS chunks so memory stays bounded and
+    # a crash keeps everything translated so far
+    written = 0
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        buf = []
         
-        try:
-            result = translator.translate(
-                text=phrase,
-                source_lang="eng_Latn",
-                target_lang="hat_Latn",
-                audience="patient"
-            )
+        for start in range(0, len(phrases), batch_size):
+            batch = phrases[start:start + batch_size]
+            print(f"[{start + len(batch)}/{len(phrases)}] Translating batch: {batch[0][:50]}...")
             
-            results.append({
-                'src_text': phrase,
-                'src_lang': 'eng_Latn',
-                'tgt_text_literal': '',  # Leave blank for team to fill
-                'tgt_text_localized': result.translation,
-                'tgt_lang': 'hat_Latn',
-                'domain': domain,
-                'cultural_note': 'GENERATED: Needs human review and correction',
-                'confidence': f"{result.confidence:.2f}",
-                'curation_status': 'draft',
-                'audience': 'patient'
-            })
+            try:
+                batch_results = translator.translate_batch(
+                    batch,
+                    source_lang="eng_Latn",
+                    target_lang="hat_Latn",
+                    audience="patient"
+                )
+            except Exception as e:
+                # Retry the failing batch one phrase at a time so only the
+                # offending phrases are marked as failed
+                print(f"  ⚠️  Batch error: {e}; retrying phrases individually")
+                batch_results = []
+                for phrase in batch:
+                    try:
+                        batch_results.extend(translator.translate_batch(
+                            [phrase],
+                            source_lang="eng_Latn",
+                            target_lang="hat_Latn",
+                            audience="patient"
+                        ))
+                    except Exception as e:
+                        print(f"  ⚠️  Error: {e}")
+                        batch_results.append(e)
             
-        except Exception as e:
-            print(f"  ⚠️  Error: {e}")
-            results.append({
-                'src_text': phrase,
-                'src_lang': 'eng_Latn',
-                'tgt_text_literal': '',
-                'tgt_text_localized': '[TRANSLATION_FAILED]',
-                'tgt_lang': 'hat_Latn',
-                'domain': domain,
-                'cultural_note': f'ERROR: {str(e)}',
-                'confidence': '0.0',
-                'curation_status': 'draft',
-                'audience': 'patient'
-            })
-    
-    # Write CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=results[0].keys())
-        writer.writeheader()
-        writer.writerows(results)
+            for phrase, result in zip(batch, batch_results):
+                if isinstance(result, Exception):
+                    buf.append((
+                        phrase, 'eng_Latn', '', '[TRANSLATION_FAILED]', 'hat_Latn',
+                        domain, f'ERROR: {str(result)}', '0.0', 'draft', 'patient'
+                    ))
+                    continue
+                
+                # tgt_text_literal is left blank for the team to fill
+                buf.append((
+                    phrase, 'eng_Latn', '', result.translation, 'hat_Latn',
+                    domain, 'GENERATED: Needs human review and correction',
+                    f"{result.confidence:.2f}", 'draft', 'patient'
+                ))
+            
+            if len(buf) >= FLUSH_ROWS:
+                writer.writerows(buf)
+                written += len(buf)
+                buf.clear()
+                f.flush()
+        
+        writer.writerows(buf)
+        written += len(buf)
     
-    print(f"\n✅ Generated {len(results)} translations")
+    print(f"\n✅ Generated {written} translations")
     print(f"📁 Output: {output_path}")
     print(f"\n📝 Next steps:")
     print(f"1. Review and correct translations in: {output_path}")
@@ -255,7 +299,7 @@ def generate_corpus(
     print(f"5. Ingest corrected CSV:")
     print(f"   python src/data/ingest_sources.py {output_path} --type corpus")
     
-    return len(results)
+    return written
 
 
 def main():
@@ -295,13 +339,52 @@ Examples:
         help='Output CSV file (default: data/seed/generated_corpus.csv)'
     )
     
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=BATCH_SIZE,
+        help=f'Phrases per translation batch (default: {BATCH_SIZE})'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=['transformers', 'ctranslate2'],
+        default='transformers',
+        help='Translation backend (default: transformers)'
+    )
+    
+    parser.add_argument(
+        '--ct2-model',
+        default='ct2_nllb',
+        help='CTranslate2 model directory for --backend ctranslate2 (default: ct2_nllb)'
+    )
+    
+    parser.add_argument(
+        '--device-index',
+        type=lambda value: [int(i) for i in value.split(',')],
+        default=None,
+        help='Comma-separated GPU indices for --backend ctranslate2, e.g. 0,1,2,3'
+    )
+    
+    parser.add_argument(
+        '--inter-threads',
+        type=int,
+        default=1,
+        help='CTranslate2 workers per device; batches are sharded across them (default: 1)'
+    )
+    
     args = parser.parse_args()
     
     try:
         count = generate_corpus(
             domain=args.domain,
             count=args.count,
-            output_csv=args.output
+            output_csv=args.output,
+            batch_size=args.batch_size,
+            backend=args.backend,
+            ct2_model_path=args.ct2_model,
+            device_index=args.device_index,
+            inter_threads=args.inter_threads
         )
         
         print(f"\n🎉 Success! Generated {count} translations for review")
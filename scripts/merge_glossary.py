@@ -98,9 +98,9 @@ def save_merged_glossary(merged_data):
     fieldnames = list(merged_data[0].keys())
     
     with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(merged_data)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(tuple(row.get(k, '') for k in fieldnames) for row in merged_data)
     
     print(f"\n✅ Merged glossary saved to: {output_path}")
     print(f"   Total entries: {len(merged_data)}")
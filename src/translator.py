@@ -15,15 +15,17 @@ os.environ['CURL_CA_BUNDLE'] = ''
 os.environ['REQUESTS_CA_BUNDLE'] = ''
 ssl._create_default_https_context = ssl._create_unverified_context
 
+import math
 import time
 import torch
 from pathlib import Path
 import yaml
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
 
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+# ISO 639-1 codes accepted by the public API mapped to the FLORES-200 language
+# tokens NLLB expects; codes already in FLORES form (containing "_") pass through
+NLLB_LANG_CODES = {"en": "eng_Latn", "ht": "hat_Latn"}
 
 
 @dataclass
@@ -48,7 +50,12 @@ class KalimaxTranslator:
         model_name: str = "facebook/nllb-200-distilled-600M",
         lora_adapter_path: Optional[str] = None,
         device: str = "auto",
-        config_path: Optional[str] = None
+        config_path: Optional[str] = None,
+        backend: str = "transformers",
+        ct2_model_path: str = "ct2_nllb",
+        spm_model_path: Optional[str] = None,
+        device_index: Union[int, List[int]] = 0,
+        inter_threads: int = 1
     ):
         """
         Initialize the Kalimax translator
@@ -58,9 +65,23 @@ class KalimaxTranslator:
             lora_adapter_path: Path to fine-tuned LoRA adapter (if available)
             device: Device to run inference on ("auto", "cpu", "cuda")
             config_path: Path to config YAML file
+            backend: "transformers" (HF model) or "ctranslate2" (int8 NLLB
+                converted with ct2-transformers-converter)
+            ct2_model_path: Converted CTranslate2 model directory
+            spm_model_path: SentencePiece model for the ctranslate2 backend
+                (default: sentencepiece.bpe.model inside ct2_model_path)
+            device_index: GPU index or list of indices for the ctranslate2 backend
+            inter_threads: CTranslate2 workers per device (batches translated in parallel)
         """
         # Load config
         self.config = self._load_config(config_path)
+        self.lora_adapter_path = lora_adapter_path
+        self.backend = backend
+        self.ct2_model_path = ct2_model_path
+        self.spm_model_path = spm_model_path or str(Path(ct2_model_path) / "sentencepiece.bpe.model")
+        self.device_index = device_index
+        self.inter_threads = inter_threads
+        self.ct2_workers = inter_threads * (len(device_index) if isinstance(device_index, list) else 1)
         
         # Model settings
         self.model_name = self.config.get('model', {}).get('name', 'google/mt5-large')
@@ -85,7 +106,10 @@ class KalimaxTranslator:
         print(f"🚀 Initializing Kalimax translator on {self.device}...")
         
         # Load model and tokenizer
-        self._load_model()
+        if self.backend == "ctranslate2":
+            self._load_ct2_model(device)
+        else:
+            self._load_model()
 
         # Initialize code-switching support
         self._init_code_switch_detection()
@@ -113,6 +137,12 @@ class KalimaxTranslator:
         Returns:
             Translated text
         """
+        # The CTranslate2 backend has no HF model/tokenizer loaded
+        if self.backend == "ctranslate2":
+            return self._translate_batch_ct2(
+                [text], source_lang, target_lang, domain, max_length, num_beams=4
+            )[0].translation
+
         # Build input with control tokens for mT5
         control_tokens = f"<src:{source_lang}> <tgt:{target_lang}> <domain:{domain}> <audience:{audience}>"
         input_text = f"{control_tokens} {text}"
@@ -142,6 +172,157 @@ class KalimaxTranslator:
         translated = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         return translated.strip()
     
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str = "en",
+        target_lang: str = "ht",
+        domain: str = "medical",
+        audience: str = "patient",
+        max_length: int = 128,
+        num_beams: int = 4
+    ) -> List[TranslationResult]:
+        """
+        Translate several texts in one padded generate() call
+        
+        Args:
+            texts: Input texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            domain: Domain context (medical, general, etc.)
+            audience: Target audience (patient, clinician, general)
+            max_length: Maximum input and output length in tokens
+            num_beams: Beam width
+            
+        Returns:
+            One TranslationResult per input, in order; confidence is the
+            exponentiated beam score and processing_time the per-text share
+        """
+        if self.backend == "ctranslate2":
+            return self._translate_batch_ct2(texts, source_lang, target_lang, domain, max_length, num_beams)
+        
+        start = time.time()
+        control_tokens = f"<src:{source_lang}> <tgt:{target_lang}> <domain:{domain}> <audience:{audience}>"
+        
+        # Tokenize the whole batch, padded to its longest input
+        inputs = self.tokenizer(
+            [f"{control_tokens} {text}" for text in texts],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=max_length
+        ).to(self.device)
+        
+        with torch.no_grad():
+            outputs = self.model.generate(
+                **inputs,
+                max_length=max_length,
+                num_beams=num_beams,
+                early_stopping=True,
+                do_sample=False,
+                pad_token_id=self.tokenizer.pad_token_id,
+                eos_token_id=self.tokenizer.eos_token_id,
+                return_dict_in_generate=True,
+                output_scores=True
+            )
+        
+        translations = self.tokenizer.batch_decode(outputs.sequences, skip_special_tokens=True)
+        scores = getattr(outputs, 'sequences_scores', None)
+        elapsed = (time.time() - start) / max(len(texts), 1)
+        
+        return [
+            TranslationResult(
+                translation=translation.strip(),
+                confidence=max(0.0, min(1.0, torch.exp(scores[i]).item())) if scores is not None else 0.5,
+                domain=domain,
+                processing_time=elapsed
+            )
+            for i, translation in enumerate(translations)
+        ]
+    
+    def _translate_batch_ct2(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        domain: str,
+        max_length: int,
+        num_beams: int
+    ) -> List[TranslationResult]:
+        """Translate a batch through CTranslate2 using NLLB language-token framing"""
+        start = time.time()
+        source_lang = NLLB_LANG_CODES.get(source_lang, source_lang)
+        target_lang = NLLB_LANG_CODES.get(target_lang, target_lang)
+        
+        # NLLB source framing: [src_lang] + subwords + </s>; target forced to start with tgt_lang
+        sources = [[source_lang] + tokens + ["</s>"] for tokens in self.sp.encode(texts, out_type=str)]
+        options = dict(
+            batch_type="tokens",
+            max_batch_size=2048,
+            beam_size=num_beams,
+            max_decoding_length=max_length,
+            return_scores=True,
+            normalize_scores=True
+        )
+        
+        # One contiguous shard per CTranslate2 worker (inter_threads per
+        # device), submitted asynchronously so all workers run at once
+        workers = min(self.ct2_workers, len(sources))
+        if workers > 1:
+            size = -(-len(sources) // workers)
+            pending = [
+                self.ct2_translator.translate_batch(
+                    sources[i:i + size],
+                    target_prefix=[[target_lang]] * len(sources[i:i + size]),
+                    asynchronous=True,
+                    **options
+                )
+                for i in range(0, len(sources), size)
+            ]
+            results = [async_result.result() for shard in pending for async_result in shard]
+        else:
+            results = self.ct2_translator.translate_batch(
+                sources,
+                target_prefix=[[target_lang]] * len(sources),
+                **options
+            )
+        elapsed = (time.time() - start) / max(len(texts), 1)
+        
+        return [
+            TranslationResult(
+                translation=self.sp.decode(result.hypotheses[0][1:]).strip(),
+                confidence=max(0.0, min(1.0, math.exp(result.scores[0]))),
+                domain=domain,
+                processing_time=elapsed
+            )
+            for result in results
+        ]
+    
+    def _load_ct2_model(self, device: str):
+        """Load the int8 CTranslate2 model and its SentencePiece tokenizer"""
+        try:
+            import ctranslate2
+            import sentencepiece as spm
+        except ImportError as e:
+            raise ImportError(
+                f"Required packages not installed: {e}. "
+                "Please run: pip install ctranslate2 sentencepiece"
+            )
+        
+        try:
+            print(f"📥 Loading CTranslate2 model: {self.ct2_model_path}...")
+            self.ct2_translator = ctranslate2.Translator(
+                self.ct2_model_path,
+                device=device,
+                device_index=self.device_index,
+                compute_type="int8",
+                inter_threads=self.inter_threads
+            )
+            self.sp = spm.SentencePieceProcessor(model_file=self.spm_model_path)
+            print(f"✅ Model loaded successfully on {self.device}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to load CTranslate2 model: {e}")
+    
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         if config_path is None: